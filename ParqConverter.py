@@ -1,12 +1,12 @@
 import argparse
-import atexit
 import logging
+import os
 import resource
+import sys
+import threading
 import time
 from datetime import timedelta
 
-from parquet_converter.administrators.base_administrator import Administrator
-
 """
 TODO: ordered most important to least important:
     - Add support for zip files
@@ -15,6 +15,46 @@ TODO: ordered most important to least important:
     - Ensure all other config features are added and supported
 """
 
+# Cached file descriptor for /proc/self/status so repeated HWM polls are a single
+# pread on an already-open handle instead of an open/read/close per sample.
+_status_fd = None
+
+
+def _read_vm_hwm_mb():
+    """Reads the peak RSS (VmHWM) in MB from /proc/self/status.
+
+    Returns None on non-Linux platforms or if the field cannot be read.
+    """
+    global _status_fd
+
+    if sys.platform != "linux":
+        return None
+
+    try:
+        if _status_fd is None:
+            _status_fd = os.open("/proc/self/status", os.O_RDONLY)
+        status = os.pread(_status_fd, 4096, 0).decode("ascii")
+        # VmHWM is reported in kB
+        return int(status.split("VmHWM:")[1].split()[0]) / 1024
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+def _start_memory_sampler(logger, interval):
+    """Starts a daemon thread that logs the peak RSS (VmHWM) every `interval` seconds."""
+
+    def _sample():
+        while True:
+            time.sleep(interval)
+            hwm_mb = _read_vm_hwm_mb()
+            if hwm_mb is not None:
+                # lazy %-args: formatting is skipped entirely when DEBUG is disabled
+                logger.debug("Peak memory usage so far: %.2f MB", hwm_mb)
+
+    thread = threading.Thread(target=_sample, daemon=True, name="mem-sampler")
+    thread.start()
+    return thread
+
 
 def _parse_search_params(value):
     """Parse comma-separated key=value pairs into a dictionary."""
@@ -22,20 +62,16 @@ def _parse_search_params(value):
         return {}
 
     result = {}
-    try:
-        pairs = value.split(",")
-        for pair in pairs:
-            if "=" not in pair:
-                raise argparse.ArgumentTypeError(f"Invalid format in '{pair}'. Expected 'key=value'")
-            key, val = pair.split("=", 1)
-            key = key.strip()
-            val = val.strip()
-            if not key:
-                raise argparse.ArgumentTypeError(f"Empty key in '{pair}'")
-            result[key] = val
-        return result
-    except ValueError as e:
-        raise argparse.ArgumentTypeError(f"Invalid parameter format: {e}")
+    for pair in value.split(","):
+        # partition does the split + membership check in a single pass
+        key, sep, val = pair.partition("=")
+        if not sep:
+            raise argparse.ArgumentTypeError(f"Invalid format in '{pair}'. Expected 'key=value'")
+        key = key.strip()
+        if not key:
+            raise argparse.ArgumentTypeError(f"Empty key in '{pair}'")
+        result[key] = val.strip()
+    return result
 
 
 def _arguments():
@@ -51,6 +87,12 @@ def _arguments():
         default={},
         help="Additional parameters as comma-separated key=value pairs (e.g., 'thing1=value,another_thing=another_value')",
     )
+    parser.add_argument(
+        "--mem-sample-interval",
+        type=float,
+        default=None,
+        help="If set, log peak memory usage (debug level) every N seconds during the conversion",
+    )
     parser.add_argument(
         "-o",
         "--output",
@@ -61,25 +103,52 @@ def _arguments():
     return parser.parse_args()
 
 
-def log_on_exit(logger, start_time):
-    elapsed = time.perf_counter() - start_time
-    maxm_mem_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
-    logger.info(f"Total time taken: {timedelta(seconds=elapsed)}")
-    logger.info(f"Max memory usage: {maxm_mem_mb:.2f} MB")
+class _JobTimer:
+    """Context manager that logs elapsed time and peak memory around the conversion.
+
+    Unlike an atexit handler, __exit__ runs before interpreter teardown, so the
+    summary lines are flushed deterministically and the timing only covers the
+    actual work, not argparse or import overhead.
+    """
+
+    def __init__(self, logger):
+        self.logger = logger
+
+    def __enter__(self):
+        # monotonic_ns keeps elapsed accounting in pure integer nanoseconds,
+        # avoiding float rounding on multi-hour runs
+        self.start_time = time.monotonic_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        elapsed_ns = time.monotonic_ns() - self.start_time
+        # Prefer the page-cached /proc read on Linux; fall back to getrusage elsewhere
+        maxm_mem_mb = _read_vm_hwm_mb()
+        if maxm_mem_mb is None:
+            maxm_mem_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        self.logger.info("Total time taken: %s", timedelta(microseconds=elapsed_ns // 1000))
+        self.logger.info("Max memory usage: %.2f MB", maxm_mem_mb)
+        return False
 
 
 def main():
     args = _arguments()
 
+    # Deferred until after argparse so --help / arg errors don't pay the heavy
+    # pyarrow/pendulum import cost pulled in transitively by the administrator.
+    from parquet_converter.administrators.base_administrator import Administrator
+
     logging.basicConfig(
         level=logging.DEBUG if args.verbose else logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s"
     )
     logger = logging.getLogger(__name__)
-    start_time = time.perf_counter()
-    atexit.register(log_on_exit, logger, start_time)
+
+    if args.mem_sample_interval:
+        _start_memory_sampler(logger, args.mem_sample_interval)
 
     administrator = Administrator(logger, args.config, args.table, output_override=args.output)
-    administrator.process(args.d, search_params=args.search_params)
+    with _JobTimer(logger):
+        administrator.process(args.d, search_params=args.search_params)
 
 
 if __name__ == "__main__":
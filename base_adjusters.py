@@ -1,34 +1,72 @@
-from abc import ABC, abstractmethod
-from typing import Any
+"""Base classes for adjusters.
 
-import pendulum
+Convention for subclasses: any logging inside per-batch paths (ex: `add_metadata`)
+must use the logger's lazy %-args form — `logger.debug("rows=%d", n)` — rather than
+f-strings, so disabled levels skip formatting entirely.
+"""
 
-from parquet_converter.core.types import Batch
+from __future__ import annotations
+
+import calendar
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+
+if TYPE_CHECKING:
+    import datetime
+
+    import pendulum
+
+from parquet_converter.core.ops_registry import get_ops
+from parquet_converter.core.types import Batch, LogicalType, TimestampType
 from parquet_converter.utils.config import MetadataConfig
 
+ops = get_ops()
+
+
+def _epoch_microseconds(kt: "datetime.datetime") -> int:
+    """Converts a datetime to int64 epoch microseconds, UTC.
+
+    Accepts both pendulum.DateTime and plain datetime.datetime —
+    mtime-sourced knowledge times are plain datetimes, and zip member mtimes
+    are additionally naive (zip stores no zone); naive values are treated as
+    UTC, matching how the constant-column cast handled them. timegm over
+    utctimetuple keeps the arithmetic in exact integers rather than rounding
+    through a float timestamp.
+
+    Args:
+        kt (datetime.datetime): aware or naive datetime.
+
+    Returns:
+        int: microseconds since the epoch, UTC.
+    """
+
+    return calendar.timegm(kt.utctimetuple()) * 1_000_000 + kt.microsecond
+
 
-class BaseAdjuster(ABC):
-    """An abstract class responsible for any intermediate adjustments to raw file(s) prior to writing them out.
+@runtime_checkable
+class BaseAdjuster(Protocol):
+    """Protocol for any intermediate adjustments to raw file(s) prior to writing them out.
 
     Depending on the dataset/vendor, we may want to have different kinds of adjusters. The only required method at
-    the moment is the abstract `adjust` method, which can be customized. Other kinds of methods can be added in classes
-    that inherit this as well; it just depends on the data and desired output.
+    the moment is the `adjust` method, which can be customized. Other kinds of methods can be added in classes
+    that implement this as well; it just depends on the data and desired output. Like the Batch/BatchOps protocols
+    in core.types, this is structural: adjusters don't need to inherit from it, just provide the methods.
     """
 
-    @abstractmethod
     def adjust(self, adjustment: Any) -> None:
         """Applies adjustments to the data.
 
         Args:
             adjustment (Any): the specific adjustment to be applied.
         """
-        pass
+        ...
 
 
-class BaseMetadataAdjuster(BaseAdjuster):
-    """An abstract class inheriting from BaseAdjuster, responsible for adding metadata columns.
+class BaseMetadataAdjuster:
+    """Base class responsible for adding metadata columns, satisfying the BaseAdjuster protocol.
 
-    This is an abstract class with three main abstract methods that serve as a foundation for metadata column creation.
+    This is a plain base class with three main overridable methods that serve as a foundation for metadata column
+    creation. Subclasses must override them; the stubs here raise NotImplementedError. Avoiding ABCMeta keeps
+    subclass instantiation cheap since add_metadata is invoked per-batch in a tight loop.
     This class allows us to have as many different ways we would like for creating the metadata columns.
 
     Attributes:
@@ -38,6 +76,12 @@ class BaseMetadataAdjuster(BaseAdjuster):
           we should be adding, etc.
     """
 
+    # Slot the single attribute: instances skip the per-instance __dict__ and
+    # attribute access goes through the C-level slot descriptor. Subclasses
+    # should declare their own __slots__ (empty if they add no attributes)
+    # to keep the benefit.
+    __slots__ = ("metadata_config",)
+
     def __init__(self, metadata_config: MetadataConfig) -> None:
         """Initializes the metadata adjuster.
 
@@ -47,7 +91,6 @@ class BaseMetadataAdjuster(BaseAdjuster):
         """
         self.metadata_config = metadata_config
 
-    @abstractmethod
     def get_knowledge_time(self, raw_file: Any) -> pendulum.DateTime:
         """Determines the knowledge time for a raw file.
 
@@ -60,19 +103,41 @@ class BaseMetadataAdjuster(BaseAdjuster):
         Returns:
             pendulum.DateTime: the knowledge time as a timezone-aware datetime in UTC.
         """
-        pass
+        raise NotImplementedError
+
+    def get_knowledge_time_us(self, raw_file: Any) -> int:
+        """Determines the knowledge time for a raw file as int64 epoch microseconds (UTC).
+
+        This is the hot-path representation used when building the _knowledge_time
+        column: an int64 scalar broadcasts straight into an Arrow timestamp column
+        without boxing a datetime per batch. The default implementation derives it
+        from `get_knowledge_time`; subclasses that already know the epoch value can
+        override this directly.
+
+        Args:
+            raw_file (Any): RawFileInfo object containing file metadata and path information.
+
+        Returns:
+            int: the knowledge time as microseconds since the epoch, UTC.
+        """
+        return _epoch_microseconds(self.get_knowledge_time(raw_file))
 
-    @abstractmethod
     def adjust(self, adjustment: Any) -> None:
         """Applies any desired adjustments.
 
         Args:
             adjustment: the specific adjustment to be applied.
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
-    def add_metadata(self, batch: Batch, start_index: int, end_index: int, raw_file: Any) -> Batch:
+    def add_metadata(
+        self,
+        batch: Batch,
+        start_index: int,
+        raw_file: Any,
+        extra_constants: dict[str, Any] | None = None,
+        extra_schema_hints: dict[str, Any] | None = None,
+    ) -> Batch:
         """Adds the metadata columns to an individual batch of data.
 
         This method appends metadata columns to the batch, including standard columns
@@ -82,10 +147,110 @@ class BaseMetadataAdjuster(BaseAdjuster):
         Args:
             batch (Batch): the current batch of data that we are adding metadata to.
             start_index (int): the starting row index for this batch (for _index column).
-            end_index (int): the ending row index for this batch (for _index column).
             raw_file (Any): RawFileInfo object containing source file information.
+            extra_constants (dict[str, Any] | None): caller-supplied constant columns
+                (ex: null fills for source_optional columns) to append in the same
+                batch rebuild as the standard constants rather than a separate op.
+            extra_schema_hints (dict[str, Any] | None): logical type hints for
+                extra_constants.
 
         Returns:
             Batch: the batch with added metadata columns.
         """
-        pass
+        raise NotImplementedError
+
+    def _append_standard_metadata(
+        self,
+        batch: Batch,
+        start_index: int,
+        raw_file: Any,
+        extra_constants: dict[str, Any] | None = None,
+        extra_schema_hints: dict[str, Any] | None = None,
+    ) -> Batch:
+        """Appends the standard metadata columns to a batch using vectorized ops.
+
+        Concrete helper shared by all metadata adjusters. All columns are built through
+        the backend ops layer (single C-level calls per column: repeated constants and an
+        arange for _index) rather than per-row Python loops, so implementations of
+        `add_metadata` should delegate here instead of constructing columns themselves.
+        Uses `get_knowledge_time`, so subclasses must have implemented it. Any
+        extra_constants are folded into the same append as the standard constants,
+        so the batch is rebuilt once regardless of how many constants ride along.
+
+        Args:
+            batch (Batch): the current batch of data that we are adding metadata to.
+            start_index (int): the starting row index for this batch (for _index column).
+            raw_file (Any): RawFileInfo object containing source file information.
+            extra_constants (dict[str, Any] | None): additional constant columns to
+                append alongside the standard ones.
+            extra_schema_hints (dict[str, Any] | None): logical type hints for
+                extra_constants.
+
+        Returns:
+            Batch: the batch with the standard metadata columns appended.
+        """
+        batch = self._append_standard_constants(batch, raw_file, extra_constants, extra_schema_hints)
+        return self._append_index_column(batch, start_index)
+
+    @staticmethod
+    def _append_index_column(batch: Batch, start_index: int) -> Batch:
+        """Appends the _index column as a vectorized int64 range.
+
+        This is the canonical way for subclasses to build _index: the backend fills
+        the range in a single C-level arange (8-byte int64s), never materializing
+        Python ints. Do not build the column via `list(range(...))`.
+
+        Args:
+            batch (Batch): the batch to append _index to.
+            start_index (int): the starting row index for this batch.
+
+        Returns:
+            Batch: the batch with the appended _index column.
+        """
+
+        return ops.append_range_column(batch, "_index", start_index, LogicalType.INT64)
+
+    def _append_standard_constants(
+        self,
+        batch: Batch,
+        raw_file: Any,
+        extra_constants: dict[str, Any] | None = None,
+        extra_schema_hints: dict[str, Any] | None = None,
+    ) -> Batch:
+        """Appends the constant standard metadata columns (everything except _index)."""
+
+        knowledge_time = self.get_knowledge_time(raw_file)
+        # int64 epoch microseconds broadcast + cast directly to timestamp[us, UTC];
+        # _epoch_microseconds also covers the plain/naive datetimes the mtime
+        # source returns, which have no int_timestamp
+        knowledge_time_us = _epoch_microseconds(knowledge_time)
+
+        # metadata information (scalars only - no lists!)
+        md = {
+            "_source_file": raw_file.full_file_name,
+            "_source_file_mtime": raw_file.meta_data["file_mtime"],
+            "_creation_time": raw_file.creation_time,
+            "_knowledge_time": knowledge_time_us,
+            "_knowledge_date": knowledge_time.date(),
+        }
+
+        schema_hints = {
+            "_source_file": LogicalType.STRING,
+            "_source_file_mtime": TimestampType(unit="us", tz="UTC"),
+            "_creation_time": TimestampType(unit="us", tz="UTC"),
+            "_knowledge_time": TimestampType(unit="us", tz="UTC"),
+            "_knowledge_date": LogicalType.DATE32,
+        }
+
+        # Fuse caller-supplied constants (ex: optional-column null fills) into the
+        # same append so the underlying table is rebuilt once, not per group.
+        # They must land before the standard metadata block: the writer schema
+        # places optional columns at their manifest positions, ahead of the
+        # metadata columns.
+        if extra_constants:
+            md = {**extra_constants, **md}
+            if extra_schema_hints:
+                schema_hints = {**extra_schema_hints, **schema_hints}
+
+        # Add constant columns
+        return ops.append_constant_columns(batch, md, schema_hints)
@@ -1,8 +1,16 @@
+import functools
 import importlib
+import itertools
 import logging
+import multiprocessing
 import os
+import queue
+import string
+import tempfile
+import threading
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
@@ -15,6 +23,7 @@ from parquet_converter.core.types import RecordSchema
 from parquet_converter.core.ops_registry import get_ops
 OPS = get_ops() 
 
+@functools.lru_cache(maxsize=None)
 def import_class(class_path):
     """Dynamically imports a class from a module path relative to parquet_converter.
 
@@ -22,6 +31,10 @@ def import_class(class_path):
     and imports that class from the parquet_converter package. This allows us to have flexible
     class instantiation for readers, writers, and adjusters.
 
+    Results are cached: importlib.import_module takes the import lock and walks
+    sys.modules on every call, and the same few classes are looked up repeatedly
+    (the writer class once per file in per-file mode).
+
     Args:
         class_path (str): dot-separated path to the class, relative to parquet_converter
             (ex: 'readers.PyArrowCsvReader' or 'adjusters.metadata_adjusters.StandardMetadataAdjuster').
@@ -49,6 +62,40 @@ def import_class(class_path):
     return getattr(module, class_name)
 
 
+def _compile_template(template):
+    """Pre-parses a str.format-style path template into a render function.
+
+    str.format re-parses the template on every call; the administrator formats
+    the same manifest/output templates once per file. This splits the template
+    into its literal and field parts a single time and returns a closure that
+    just concatenates lookups. Only plain named fields (ex: '{YYYYMMDD}') with
+    optional format specs are supported, which is all the path templates use.
+
+    Args:
+        template (str): format template to compile.
+
+    Returns:
+        Callable[[dict], str]: renderer taking the format dictionary.
+    """
+
+    parts = [
+        (literal, field, spec)
+        for literal, field, spec, _conv in string.Formatter().parse(template)
+    ]
+
+    def render(format_dict):
+        out = []
+        for literal, field, spec in parts:
+            if literal:
+                out.append(literal)
+            if field is not None:
+                value = format_dict[field]
+                out.append(format(value, spec) if spec else str(value))
+        return "".join(out)
+
+    return render
+
+
 def format_time(seconds):
     """Format elapsed time in seconds to a human-readable string.
 
@@ -138,6 +185,9 @@ class Administrator(BaseAdministrator):
         self.logger = logger
         self.config = Config.from_yaml(config_path)
         self.table = table
+        # Kept for re-constructing equivalent administrators in worker processes
+        self.config_path = config_path
+        self.output_override = output_override
 
         # Get table config
         table_config = self.config.get_table_config(table)
@@ -153,7 +203,7 @@ class Administrator(BaseAdministrator):
         if output_override is not None:
             self.basedir = ""
             self.output_template = os.path.join(output_override, "{table}_{YYYYMMDD}.parq")
-            self.logger.info(f"Output override: writing to '{self.output_template}'")
+            self.logger.info("Output override: writing to '%s'", self.output_template)
         else:
             # No override - use config's basedir
             self.basedir = self.config.output.basedir
@@ -168,6 +218,22 @@ class Administrator(BaseAdministrator):
         self.num_rows = 0
         self.sum_file_seconds = 0.0  # sum of per-file elapsed (read+write) times
 
+        # Schemas resolved per manifest path. In per-file mode every file of a
+        # table shares the same manifest, so the YAML parse and backend schema
+        # conversions only need to happen once per run, not once per file.
+        self._schema_cache: Dict[str, Tuple[Any, Any, Any, Any, Any]] = {}
+
+        # Backend conversions of (frozen, hashable) reading schemas; identical
+        # for every file of a table, so convert once and reuse per file/batch.
+        self._backend_schema_cache: Dict[Any, Any] = {}
+
+        # Pre-parse the manifest/output path templates once; they are rendered
+        # per file and str.format would otherwise re-parse them on every call
+        self._manifest_path_template = os.path.join(self.config_basedir, self.manifest_template)
+        self._manifest_path_fmt = _compile_template(self._manifest_path_template)
+        self._output_path_template = os.path.join(self.basedir, self.output_template)
+        self._output_path_fmt = _compile_template(self._output_path_template)
+
         # setup reader
         reader_name = self.config.input.reader
         reader_cls = import_class(f"readers.{reader_name}")
@@ -183,14 +249,43 @@ class Administrator(BaseAdministrator):
         adjuster_cls = import_class(f"adjusters.{adjust_name}")
         self.adjuster = adjuster_cls(self.config.output.metadata)
 
+        # Resolve the writer class once; the hot path only instantiates it
+        self.writer_cls = import_class(f"writers.{self.config.output.writer}")
+
+
+    @functools.cached_property
+    def _extract_root(self) -> tempfile.TemporaryDirectory:
+        """Shared root directory for per-file zip extraction dirs.
+
+        Created lazily the first time a zip member is opened and reused for the
+        rest of the run, so extraction dirs for every file nest under one root
+        and anything a failed file leaves behind is swept up together when the
+        TemporaryDirectory finalizer runs.
+        """
+
+        return tempfile.TemporaryDirectory(prefix="parquet_converter_")
+
+    def _open_raw_file(self, raw_file: Any) -> Any:
+        """Opens a raw file via the reader, routing zip extractions to the shared root.
+
+        Args:
+            raw_file (Any): RawFileInfo for the file to open.
+
+        Returns:
+            Any: the reader's open() result (handler, or (handler, temp_dir) tuple).
+        """
+
+        if raw_file.is_zip:
+            return self.reader.open(raw_file.full_file_path, is_zip=True, temp_root=self._extract_root.name)
+        return self.reader.open(raw_file.full_file_path, is_zip=False)
 
     def _validate_schema_against_batch(
-        self, logical_schema: Any, batch: Any, file_path: str, column_operations: dict[str, str]
+        self, logical_schema: Any, batch: Any, file_path: str, optional_cols: frozenset, ignored_cols: frozenset
     ) -> tuple[Any, set[str]]:
         """
         Validate schema against batch, handling column operations.
 
-        Column operations:
+        Column operations (precomputed into sets in _resolve_schemas):
         - "source_required": Column must exist in source (error if missing)
         - "source_optional": Column is optional (keep in schema even if missing, will be filled with nulls)
         - "output_ignored": Column should be removed from output even if present in source
@@ -199,7 +294,8 @@ class Administrator(BaseAdministrator):
             logical_schema (RecordSchema): RecordSchema from manifest
             batch (Batch): Batch object with actual data
             file_path (str): Path to file being processed (for logging)
-            column_operations (dict[str, str]): Mapping of column names to their operations
+            optional_cols (frozenset): names of source_optional columns
+            ignored_cols (frozenset): names of output_ignored columns
 
         Returns:
             tuple[RecordSchema, set[str]]: Validated RecordSchema and set of optional missing columns
@@ -207,21 +303,64 @@ class Administrator(BaseAdministrator):
 
         # Get column names from the batch - unwrap to access PyArrow table
         table = batch.unwrap()
-        batch_columns = set(table.column_names)
-        schema_columns = set(logical_schema.names())
+        return self._validate_schema_against_columns(
+            logical_schema, set(table.column_names), file_path, optional_cols, ignored_cols
+        )
 
-        # Find columns in schema that are not in the batch
-        missing_columns = schema_columns - batch_columns
+    def _validate_schema_against_columns(
+        self, logical_schema: Any, batch_columns: set, file_path: str, optional_cols: frozenset, ignored_cols: frozenset
+    ) -> tuple[Any, set[str]]:
+        """Core of schema validation, operating on a set of source column names.
 
-        # Process missing columns based on their operations
-        required_missing = []
+        Split out from _validate_schema_against_batch so validation operates on
+        plain column names, independent of how they were obtained.
 
-        for col in missing_columns:
-            operation = column_operations.get(col, "source_required")
-            if operation == "source_required":
-                required_missing.append(col)
-            # source_optional columns should not be in the reading schema at all
-            # output_ignored columns don't matter if missing
+        Args:
+            logical_schema (RecordSchema): RecordSchema from manifest
+            batch_columns (set): column names observed in the source file
+            file_path (str): Path to file being processed (for logging)
+            optional_cols (frozenset): names of source_optional columns
+            ignored_cols (frozenset): names of output_ignored columns
+
+        Returns:
+            tuple[RecordSchema, set[str]]: Validated RecordSchema and set of optional missing columns
+        """
+
+        # Fast path for the common all-source_required manifest: nothing to
+        # filter, so the incoming schema is already the validated schema and the
+        # only work is one membership pass for missing required columns.
+        # (source_optional columns should not be in the reading schema at all,
+        # and output_ignored columns don't matter if missing)
+        if not ignored_cols:
+            required_missing = [
+                name for name in logical_schema.names()
+                if name not in batch_columns and name not in optional_cols
+            ]
+            if required_missing:
+                raise ValueError(
+                    f"Schema validation failed for '{file_path}': "
+                    f"Required columns missing from raw file: {sorted(required_missing)}. "
+                    f"These columns are marked as 'source_required' and must be present in the source file."
+                )
+            return logical_schema, set()
+
+        # Single classification pass over the fields: drop output_ignored
+        # columns, collect missing required ones, keep the rest. Avoids the
+        # intermediate schema-name set and set-difference allocations.
+        debug_ignored = self.logger.isEnabledFor(logging.DEBUG)
+        required_missing = []
+        validated_fields = []
+        for field in logical_schema.fields:
+            name = field.name
+            if name in ignored_cols:
+                if debug_ignored:
+                    self.logger.debug("Ignoring column '%s' (marked as output_ignored)", name)
+                continue
+            if name not in batch_columns:
+                if name not in optional_cols:
+                    required_missing.append(name)
+                continue
+            validated_fields.append(field)
 
         # Error out if required columns are missing
         if required_missing:
@@ -231,23 +370,84 @@ class Administrator(BaseAdministrator):
                 f"These columns are marked as 'source_required' and must be present in the source file."
             )
 
-        # Filter the schema:
-        # 1. Remove columns marked as "output_ignored"
-        # 2. Keep "source_required" columns (all present since we error if missing)
-        # Note: source_optional columns are not in the reading schema
-        validated_fields = []
-        for field in logical_schema.fields:
-            operation = column_operations.get(field.name, "source_required")
+        return RecordSchema(fields=tuple(validated_fields)), set()
 
-            # Skip output_ignored columns
-            if operation == "output_ignored":
-                self.logger.debug(f"Ignoring column '{field.name}' (marked as output_ignored)")
-                continue
+    def _resolve_schemas(self, manifest_path: str) -> Tuple[Any, Any, Any, Any, Any, Any]:
+        """Resolves the logical/reading/output/writing schemas for a manifest, with caching.
 
-            # Keep source_required columns (they must all be present)
-            validated_fields.append(field)
+        All files of a table resolve to the same manifest, so the manifest parse,
+        the column-operation filtering and the backend schema conversions are
+        cached per manifest path and only computed once per run.
 
-        return RecordSchema(fields=tuple(validated_fields)), set()
+        Args:
+            manifest_path (str): resolved path to the manifest JSON file.
+
+        Returns:
+            Tuple: (logical_schema, optional_cols, ignored_cols, reading_schema,
+            output_schema, writing_schema) where optional_cols/ignored_cols are
+            frozensets of source_optional / output_ignored column names and
+            writing_schema is the unified backend schema for the writer.
+        """
+
+        cached = self._schema_cache.get(manifest_path)
+        if cached is not None:
+            return cached
+
+        # Get logical schemas with column operations
+        logical_schema, column_operations = Manifest.get_schema_with_operations(manifest_path)
+        metadata_schema = Manifest.get_metadata_schema(self.config.output.metadata)
+
+        # Collapse the per-column operation strings into membership sets once;
+        # everything downstream classifies fields with O(1) `name in set` checks
+        # instead of dict-get + string compares per field
+        optional_cols = frozenset(c for c, op in column_operations.items() if op == "source_optional")
+        ignored_cols = frozenset(c for c, op in column_operations.items() if op == "output_ignored")
+
+        # In the common case every column is source_required and both filtered
+        # schemas are just the logical schema itself; skip rebuilding them (this
+        # also keeps one shared, hashable schema object for downstream caches)
+        if not optional_cols and not ignored_cols:
+            reading_schema = output_schema = logical_schema
+        else:
+            # Reading schema: excludes source_optional columns (will be added as nulls later)
+            reading_schema = RecordSchema(
+                fields=tuple(field for field in logical_schema.fields if field.name not in optional_cols)
+            )
+
+            # Output schema: excludes output_ignored columns, includes everything else
+            output_schema = RecordSchema(
+                fields=tuple(field for field in logical_schema.fields if field.name not in ignored_cols)
+            )
+
+        # Convert output schema (excludes output_ignored) to backend schema and
+        # unify with the metadata schema for writing
+        backend_output_schema = OPS.ensure_backend_schema(output_schema)
+        backend_metadata_schema = OPS.ensure_backend_schema(metadata_schema)
+        writing_schema = OPS.unify_schemas([backend_output_schema, backend_metadata_schema])
+
+        resolved = (logical_schema, optional_cols, ignored_cols, reading_schema, output_schema, writing_schema)
+        self._schema_cache[manifest_path] = resolved
+        return resolved
+
+    def _backend_reading_schema(self, reading_schema: Any) -> Any:
+        """Converts a reading schema to its backend form, caching per schema.
+
+        RecordSchema is a frozen dataclass (hashable), so the converted backend
+        schema can be memoized and shared by every file/batch that reads with
+        the same logical schema.
+
+        Args:
+            reading_schema (Any): RecordSchema to convert.
+
+        Returns:
+            Any: the backend (ex: pyarrow) schema.
+        """
+
+        cached = self._backend_schema_cache.get(reading_schema)
+        if cached is None:
+            cached = OPS.ensure_backend_schema(reading_schema)
+            self._backend_schema_cache[reading_schema] = cached
+        return cached
 
     def _get_schema_and_writer(
         self,
@@ -255,7 +455,8 @@ class Administrator(BaseAdministrator):
         validation: bool = True,
         file_path: Optional[str] = None,
         is_zip: bool = False,
-    ) -> Tuple[Any, Any, Any, set[str]]:
+        keep_open: bool = False,
+    ) -> Tuple[Any, Any, Any, set[str], Optional[Tuple[Any, Any, Any, Any]]]:
         """Set up schema and writer, optionally with validation against first batch of file.
 
         This method creates the schema and writer objects needed for the conversion process.
@@ -271,105 +472,274 @@ class Administrator(BaseAdministrator):
                 For zip files, format should be "zip_path|member".
             is_zip (bool): Whether the file is within a zip archive. Default is False.
                 Used only when validation=True.
+            keep_open (bool): When True (and validation ran), the validated file stays open and
+                the already-read first batch plus the live batch generator are handed back to the
+                caller, so the file is opened and decoded exactly once instead of twice.
 
         Returns:
-            Tuple[Any, Any, Any, set[str]]: Tuple of (output_schema, reading_schema, writer, optional_missing_cols) where:
+            Tuple[Any, Any, Any, set[str], Optional[Tuple]]: Tuple of
+            (output_schema, reading_schema, writer, optional_missing_cols, prefetched) where:
                 - output_schema is the RecordSchema for output (includes source_optional, excludes output_ignored)
                 - reading_schema is the RecordSchema to use for reading (excludes source_optional)
                 - writer is the configured writer instance (uses output_schema)
                 - optional_missing_cols is a set of source_optional column names to add as nulls
+                - prefetched is None, or (file_handler, temp_dir, first_batch, batch_gen) when
+                  keep_open=True; the caller owns closing the handler
 
         Raises:
             ValueError: If validation=True but file_path is None.
         """
-        self.logger.debug(f"Resolving manifest and output paths using the following format dictionary: {format_dict}")
+        # Rendering the format dict is itself non-trivial per file, so only do it
+        # when debug logging is actually enabled.
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Resolving manifest and output paths using the following format dictionary: %s", format_dict)
 
         # Use config's basedir for manifest (shared schema definition)
-        manifest_template = os.path.join(self.config_basedir, self.manifest_template)
-        self.logger.debug(f"Template manifest path: {manifest_template}")
-        manifest_path = manifest_template.format(**format_dict)
-        self.logger.debug(f"Resolved manifest path: {manifest_path}")
+        self.logger.debug("Template manifest path: %s", self._manifest_path_template)
+        manifest_path = self._manifest_path_fmt(format_dict)
+        self.logger.debug("Resolved manifest path: %s", manifest_path)
 
         # Use potentially overridden basedir for output files
-        full_output_template = os.path.join(self.basedir, self.output_template)
-        self.logger.debug(f"Template output path: {full_output_template}")
-        output_path = full_output_template.format(**format_dict)
-        self.logger.debug(f"Resolved output path: {output_path}")
+        self.logger.debug("Template output path: %s", self._output_path_template)
+        output_path = self._output_path_fmt(format_dict)
+        self.logger.debug("Resolved output path: %s", output_path)
 
-        # Get logical schemas with column operations
-        logical_schema, column_operations = Manifest.get_schema_with_operations(manifest_path)
-        metadata_schema = Manifest.get_metadata_schema(self.config.output.metadata)
-
-        # Reading schema: excludes source_optional columns (will be added as nulls later)
-        reading_schema_fields = [
-            field for field in logical_schema.fields
-            if column_operations.get(field.name, "source_required") != "source_optional"
-        ]
-        reading_schema = RecordSchema(fields=tuple(reading_schema_fields))
+        logical_schema, optional_cols, ignored_cols, reading_schema, output_schema, writing_schema = (
+            self._resolve_schemas(manifest_path)
+        )
 
-        # Output schema: excludes output_ignored columns, includes everything else
-        output_schema_fields = [
-            field for field in logical_schema.fields
-            if column_operations.get(field.name, "source_required") != "output_ignored"
-        ]
-        output_schema = RecordSchema(fields=tuple(output_schema_fields))
+        prefetched = None
 
         # Validate schema against first batch of the file if requested
         if validation:
             if file_path is None:
                 raise ValueError("file_path is required when validation=True")
 
-            backend_schema = OPS.ensure_backend_schema(reading_schema)
+            backend_schema = self._backend_reading_schema(reading_schema)
 
-            # Open file handler for validation
-            file_handler_result = self.reader.open(file_path, is_zip=is_zip)
-
-            # Handle both tuple (file_handler, temp_dir) and simple file_handler returns
-            if isinstance(file_handler_result, tuple):
-                file_handler, temp_dir = file_handler_result
+            # Open file handler for validation (readers uniformly return (handler, temp_dir))
+            if is_zip:
+                file_handler, temp_dir = self.reader.open(file_path, is_zip=True, temp_root=self._extract_root.name)
             else:
-                file_handler = file_handler_result
-                temp_dir = None
+                file_handler, temp_dir = self.reader.open(file_path, is_zip=False)
 
             try:
                 batch_gen = self.reader.batch_read(file_handler, schema=backend_schema)
                 first_batch = next(batch_gen)
                 validated_reading_schema, optional_missing_cols = self._validate_schema_against_batch(
-                    reading_schema, first_batch, file_path, column_operations
+                    reading_schema, first_batch, file_path, optional_cols, ignored_cols
                 )
                 # Update reading schema with validated version (may have output_ignored removed)
                 reading_schema = validated_reading_schema
+                if keep_open:
+                    # Hand the live stream back so the caller can resume it instead
+                    # of re-opening and re-decoding the file from the start.
+                    prefetched = (file_handler, temp_dir, first_batch, batch_gen)
             finally:
-                # Close file handler after validation
-                self.reader.close(file_handler, temp_dir=temp_dir)
+                if prefetched is None:
+                    # Close file handler after validation (also the error path when keep_open)
+                    self.reader.close(file_handler, temp_dir=temp_dir)
         else:
             optional_missing_cols = set()
 
         # Track which source_optional columns need to be added back
-        source_optional_cols = {
-            field.name for field in logical_schema.fields
-            if column_operations.get(field.name, "source_required") == "source_optional"
-        }
-        optional_missing_cols = optional_missing_cols.union(source_optional_cols)
+        optional_missing_cols = optional_missing_cols.union(optional_cols)
 
         create_dir(output_path)
 
-        # Get ops instance and convert output schema (excludes output_ignored) to backend schema
-        backend_output_schema = OPS.ensure_backend_schema(output_schema)
-        backend_metadata_schema = OPS.ensure_backend_schema(metadata_schema)
-
-        # Unify backend schemas for writing
-        writing_schema = OPS.unify_schemas([backend_output_schema, backend_metadata_schema])
-
-        writer_cls = import_class(f"writers.{self.config.output.writer}")
-        writer = writer_cls(self.writer_kwargs, output_path, schema=writing_schema)
+        writer = self.writer_cls(self.writer_kwargs, output_path, schema=writing_schema)
 
         # Return schemas and writer:
         # - output_schema: for building batches (includes source_optional, excludes output_ignored)
         # - reading_schema: for reader (excludes source_optional)
         # - writer: configured with output_schema
         # - optional_missing_cols: source_optional columns to add as nulls
-        return output_schema, reading_schema, writer, optional_missing_cols
+        # - prefetched: live (file_handler, temp_dir, first_batch, batch_gen) when keep_open
+        return output_schema, reading_schema, writer, optional_missing_cols, prefetched
+
+    def _convert_batches(
+        self,
+        raw_file: Any,
+        output_schema: Any,
+        reading_schema: Any,
+        writer: Any,
+        optional_missing_cols: set[str],
+        start_index: int = 0,
+        prefetched: Optional[Tuple[Any, Any, Any, Any]] = None,
+        opened: Optional[Any] = None,
+    ) -> Tuple[int, int, float]:
+        """Reads, adjusts and writes all batches of a single raw file.
+
+        This is the shared read->adjust->write pipeline used by both aggregate
+        and per-file modes; the caller is responsible for setting up (and, in
+        per-file mode, closing) the writer.
+
+        Args:
+            raw_file (Any): RawFileInfo for the file to convert.
+            output_schema (Any): RecordSchema for output batches.
+            reading_schema (Any): RecordSchema used for reading.
+            writer (Any): writer instance to write batches to.
+            optional_missing_cols (set[str]): source_optional columns to add as nulls.
+            start_index (int): base row index for the _index column. 0 in per-file
+                mode; the number of rows already written in aggregate mode.
+            prefetched (Optional[Tuple]): (file_handler, temp_dir, first_batch, batch_gen)
+                left open by schema validation. When given, the already-decoded first
+                batch and live generator are consumed instead of re-opening the file.
+            opened (Optional[Any]): an already-opened (file_handler, temp_dir) pair
+                for this file (aggregate mode opens file N+1 in the background
+                while file N is written). Ignored when prefetched is given.
+
+        Returns:
+            Tuple[int, int, float]: (total_rows, batch_num, elapsed_seconds) for this file.
+        """
+
+        if prefetched is not None:
+            # Validation already opened this file and decoded its first batch;
+            # resume from that stream rather than paying the open/decode twice.
+            file_handler, temp_dir, first_batch, batch_gen = prefetched
+            batch_iter = itertools.chain([first_batch], batch_gen)
+        else:
+            # Convert reading schema to backend schema for reader (cached per schema)
+            backend_schema = self._backend_reading_schema(reading_schema)
+
+            # Open the file handler (readers uniformly return (handler, temp_dir)),
+            # unless the caller already opened it in the background
+            if opened is not None:
+                file_handler, temp_dir = opened
+            else:
+                file_handler, temp_dir = self._open_raw_file(raw_file)
+
+            batch_iter = self.reader.batch_read(file_handler, schema=backend_schema)
+
+        t0 = time.perf_counter()  # timing start
+        total_rows = 0
+        batch_num = 0
+
+        # Bounded producer/consumer queue: the main thread reads + adjusts while a
+        # single writer thread encodes/writes the previous batch (pyarrow releases
+        # the GIL in C++), so wall time tends toward max(read, write) instead of
+        # their sum. maxsize bounds the in-flight batch memory.
+        write_queue: queue.Queue = queue.Queue(maxsize=2)
+        write_errors: list = []
+
+        def _writer_worker():
+            while True:
+                pending = write_queue.get()
+                if pending is None:
+                    break
+                if write_errors:
+                    # A previous write failed; keep draining so the producer never blocks
+                    continue
+                try:
+                    writer.write_table(pending)
+                except Exception as e:  # noqa: BLE001 - re-raised on the main thread
+                    write_errors.append(e)
+
+        writer_thread = threading.Thread(target=_writer_worker, daemon=True, name="batch-writer")
+        writer_thread.start()
+
+        # Bind hot attributes to locals: the loop body runs per batch, and
+        # LOAD_FAST beats repeated LOAD_ATTR chains when batches are many and small
+        add_metadata = self.adjuster.add_metadata
+        queue_put = write_queue.put
+
+        # Null fills for optional missing columns don't depend on the batch, so
+        # the dicts are built once here and fused into the adjuster's constant
+        # append — one batch rebuild per batch instead of two.
+        null_constants = None
+        null_hints = None
+        if optional_missing_cols:
+            null_constants = {col: None for col in optional_missing_cols}
+            null_hints = {
+                field.name: field.typ
+                for field in output_schema.fields
+                if field.name in optional_missing_cols
+            }
+
+        try:
+            for batch in batch_iter:
+
+                # add metadata columns to the table; _index continues from the
+                # rows already written (within this file, plus across files in
+                # aggregate mode via start_index)
+                if null_constants:
+                    batch = add_metadata(
+                        batch, start_index + total_rows, raw_file,
+                        extra_constants=null_constants, extra_schema_hints=null_hints,
+                    )
+                else:
+                    batch = add_metadata(batch, start_index + total_rows, raw_file)
+
+                if write_errors:
+                    break
+
+                # hand off to the writer thread
+                queue_put(batch)
+
+                # increment counters
+                total_rows += batch.num_rows()
+                batch_num += 1
+        finally:
+            write_queue.put(None)
+            writer_thread.join()
+            # Close file handler and cleanup temp directory if needed
+            self.reader.close(file_handler, temp_dir=temp_dir)
+
+        if write_errors:
+            raise write_errors[0]
+
+        elapsed = time.perf_counter() - t0  # timing end
+        return total_rows, batch_num, elapsed
+
+    def _convert_single_file(self, raw_file: Any) -> Tuple[int, int, float]:
+        """Converts one raw file to its own output file (per-file mode).
+
+        Sets up the per-file writer, runs the batch pipeline, and finalizes the
+        output. Safe to call from a worker process.
+
+        Args:
+            raw_file (Any): RawFileInfo for the file to convert.
+
+        Returns:
+            Tuple[int, int, float]: (total_rows, batch_num, elapsed_seconds) for this file.
+        """
+
+        # sets up the "file_name" template. Uses member name if zip file, else file name.
+        file_name_formater = raw_file.member_name if raw_file.is_zip else raw_file.file_name
+        # remove the '.gz' extension
+        file_name_formater = file_name_formater.replace(".gz", "")
+        # remove any extra extension
+        file_name_formater = Path(file_name_formater).stem
+
+        format_dict = {
+            **raw_file.d_formater,
+            **raw_file.extract_vars,
+            "table": self.table,
+            "file_name": file_name_formater,
+        }
+        output_schema, reading_schema, writer, optional_missing_cols, prefetched = self._get_schema_and_writer(
+            format_dict, validation=True, file_path=raw_file.full_file_path, is_zip=raw_file.is_zip, keep_open=True
+        )
+
+        # Per-file constants also land in the output file's key/value
+        # metadata so consumers can read them without scanning columns
+        file_metadata = {"_source_file": raw_file.full_file_name}
+        try:
+            file_metadata["_knowledge_time_us"] = self.adjuster.get_knowledge_time_us(raw_file)
+        except NotImplementedError:
+            # Adjusters without a knowledge-time source simply omit the key;
+            # the KV stamp must never abort the file conversion
+            pass
+        writer.add_file_metadata(file_metadata)
+
+        total_rows, batch_num, elapsed = self._convert_batches(
+            raw_file, output_schema, reading_schema, writer, optional_missing_cols, prefetched=prefetched
+        )
+
+        self.logger.info("Wrote %d row(s) in %d batch(es) to %s", total_rows, batch_num, writer.output_path)
+        writer.close()
+
+        return total_rows, batch_num, elapsed
 
     def process(self, d: str, search_params: Optional[Dict[str, str]] = None) -> None:
         """Processes all raw files for the specified date.
@@ -377,7 +747,8 @@ class Administrator(BaseAdministrator):
         This is the main conversion process, doing the following steps:
         1. Finds all raw files matching the desired patterns for the given date
         2. In aggregate mode: creates one writer for all files
-        3. In per-file mode: creates a separate writer for each file
+        3. In per-file mode: creates a separate writer for each file, optionally
+           farming files out to worker processes when output.workers > 1
         4. For each file:
            - Reads data in batches
            - Adds metadata columns to each batch
@@ -393,123 +764,126 @@ class Administrator(BaseAdministrator):
 
         run_t0 = time.perf_counter()
 
-        self.logger.info(f"Starting conversion for table: {self.table}")
-        self.logger.debug(f"Raw file templates: {self.raw_file_templates}")
+        self.logger.info("Starting conversion for table: %s", self.table)
+        self.logger.debug("Raw file templates: %s", self.raw_file_templates)
         for file_template in self.raw_file_templates:
             finder = FileFinder(
                 file_template, extract_vars=self.extract_vars, search_params=search_params, file_type=self.file_type
             )
-            self.logger.debug(str(finder))
+            # str(finder) renders all the finder's templates/regexes; skip it at INFO level
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(str(finder))
             all_raw_files = finder.find_range(d, d)
-            self.logger.debug(f"Processing {len(all_raw_files)} files for date/delta: {d}")
+            self.logger.debug("Processing %d files for date/delta: %s", len(all_raw_files), d)
 
-            # If aggregate, validate schema against first file before creating writer
             if self.aggregate:
+                # Validate schema against first file before creating the shared writer
                 format_dict = {**all_raw_files[0].d_formater, "table": self.table}
-                output_schema, reading_schema, writer, optional_missing_cols = self._get_schema_and_writer(
+                output_schema, reading_schema, writer, optional_missing_cols, prefetched = self._get_schema_and_writer(
                     format_dict,
                     validation=True,
                     file_path=all_raw_files[0].full_file_path,
                     is_zip=all_raw_files[0].is_zip,
+                    keep_open=True,
                 )
 
-            for i, raw_file in enumerate(all_raw_files, start=1):
-                self.logger.info(f"[{i}/{len(all_raw_files)}] Processing file: {raw_file.full_file_path}")
-
-                # If non-aggregate, we set up the writer and output_path once per file
-                if not self.aggregate:
-
-                    # sets up the "file_name" template. Uses member name if zip file, else file name.
-                    file_name_formater = raw_file.member_name if raw_file.is_zip else raw_file.file_name
-                    # remove the '.gz' extension
-                    file_name_formater = file_name_formater.replace(".gz", "")
-                    # remove any extra extension
-                    file_name_formater = Path(file_name_formater).stem
-
-                    format_dict = {
-                        **raw_file.d_formater,
-                        **raw_file.extract_vars,
-                        "table": self.table,
-                        "file_name": file_name_formater,
-                    }
-                    output_schema, reading_schema, writer, optional_missing_cols = self._get_schema_and_writer(
-                        format_dict, validation=True, file_path=raw_file.full_file_path, is_zip=raw_file.is_zip
-                    )
+                # Single-slot opener thread: while file N streams through the
+                # pipeline, file N+1 is opened (and, for zips, extracted) in the
+                # background so its open() latency never sits on the critical
+                # path. At most two input files are open at a time.
+                with ThreadPoolExecutor(max_workers=1, thread_name_prefix="file-opener") as opener:
+                    next_open = None
+                    for i, raw_file in enumerate(all_raw_files, start=1):
+                        self.logger.info("[%d/%d] Processing file: %s", i, len(all_raw_files), raw_file.full_file_path)
+
+                        opened = next_open.result() if next_open is not None else None
+                        if i < len(all_raw_files):
+                            next_file = all_raw_files[i]
+                            next_open = opener.submit(self._open_raw_file, next_file)
+                        else:
+                            next_open = None
 
-                # Convert reading schema to backend schema for reader
-                backend_schema = OPS.ensure_backend_schema(reading_schema)
+                        total_rows, batch_num, elapsed = self._convert_batches(
+                            raw_file, output_schema, reading_schema, writer, optional_missing_cols,
+                            start_index=self.num_rows,
+                            # Only the first file was pre-opened by validation
+                            prefetched=prefetched if i == 1 else None,
+                            opened=opened,
+                        )
 
-                # Open file handler (returns tuple for CSV with zip support, or just handler for others)
-                file_handler_result = self.reader.open(raw_file.full_file_path, is_zip=raw_file.is_zip)
+                        self.logger.info("Wrote %d row(s) in %d batch(es) in %s", total_rows, batch_num, format_time(elapsed))
+                        self._count_file(total_rows, batch_num, elapsed)
 
-                # Handle both tuple (file_handler, temp_dir) and simple file_handler returns
-                if isinstance(file_handler_result, tuple):
-                    file_handler, temp_dir = file_handler_result
-                else:
-                    file_handler = file_handler_result
-                    temp_dir = None
+                self.logger.info(
+                    "Wrote %d row(s) in %d batch(es) to %s", self.num_rows, self.num_batches, writer.output_path
+                )
+                writer.close()
 
-                t0 = time.perf_counter()  # timing start
-                total_rows = 0
-                batch_num = 0
+            elif self.config.output.workers > 1 and len(all_raw_files) > 1:
+                # Per-file mode with worker processes: files are fully independent
+                # (one writer each), so fan them out and fold the stats back in.
+                workers = min(self.config.output.workers, len(all_raw_files))
+                self.logger.info("Processing %d files with %d worker processes", len(all_raw_files), workers)
+                ctx = multiprocessing.get_context("spawn")
+                with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+                    futures = [
+                        pool.submit(_process_one_file, self.config_path, self.table, raw_file, self.output_override)
+                        for raw_file in all_raw_files
+                    ]
+                    for i, (raw_file, future) in enumerate(zip(all_raw_files, futures), start=1):
+                        total_rows, batch_num, elapsed = future.result()
+                        self.logger.info(
+                            "[%d/%d] Wrote %d row(s) in %d batch(es) in %s from %s",
+                            i, len(all_raw_files), total_rows, batch_num, format_time(elapsed), raw_file.full_file_path,
+                        )
+                        self._count_file(total_rows, batch_num, elapsed)
 
-                try:
-                    for batch in self.reader.batch_read(file_handler, schema=backend_schema):
-
-                        # Add null columns for optional missing columns
-                        if optional_missing_cols:
-                            # Build constants and schema_hints from output_schema
-                            constants = {col: None for col in optional_missing_cols}
-                            schema_hints = {
-                                field.name: field.typ
-                                for field in output_schema.fields
-                                if field.name in optional_missing_cols
-                            }
-                            batch = OPS.append_constant_columns(batch, constants, schema_hints)
-
-                        # calculate the start and end index of the batch (for _index) metadata column
-                        ## Aggregate start idx is the current number of rows written across all found files
-                        if self.aggregate:
-                            batch_start_idx = self.num_rows
-                        ## Non-Aggregate start idx is the current number of rows written from the current raw file
-                        else:
-                            batch_start_idx = total_rows
+            else:
+                for i, raw_file in enumerate(all_raw_files, start=1):
+                    self.logger.info("[%d/%d] Processing file: %s", i, len(all_raw_files), raw_file.full_file_path)
+
+                    total_rows, batch_num, elapsed = self._convert_single_file(raw_file)
+
+                    self.logger.info("Wrote %d row(s) in %d batch(es) in %s", total_rows, batch_num, format_time(elapsed))
+                    self._count_file(total_rows, batch_num, elapsed)
+
+        # format_time calls are only worth paying when the summary will be emitted
+        if self.logger.isEnabledFor(logging.DEBUG):
+            run_elapsed = time.perf_counter() - run_t0
+            avg_per_batch = (self.sum_file_seconds / self.num_batches) if self.num_batches else 0.0
+            avg_per_file = (self.sum_file_seconds / self.num_files) if self.num_files else 0.0
+            self.logger.debug(
+                "Timing summary: files=%d, batches=%d, rows=%d, total=%s, avg_per_batch=%s, avg_per_file=%s",
+                self.num_files, self.num_batches, self.num_rows,
+                format_time(run_elapsed), format_time(avg_per_batch), format_time(avg_per_file),
+            )
 
-                        # add metadata columns to the table
-                        batch = self.adjuster.add_metadata(batch, batch_start_idx, raw_file)
+    def _count_file(self, total_rows: int, batch_num: int, elapsed: float) -> None:
+        """Folds one file's stats into the run counters."""
 
-                        # write out the batch
-                        writer.write_table(batch)
+        self.num_files += 1
+        self.num_batches += batch_num
+        self.num_rows += total_rows
+        self.sum_file_seconds += elapsed
 
-                        # increment counters
-                        total_rows += batch.num_rows()
-                        batch_num += 1
-                finally:
-                    # Close file handler and cleanup temp directory if needed
-                    self.reader.close(file_handler, temp_dir=temp_dir)
 
-                if not self.aggregate:
-                    self.logger.info(f"Wrote {total_rows} row(s) in {batch_num} batch(es) to {writer.output_path}")
-                    writer.close()
-                elapsed = time.perf_counter() - t0  # timing end
+def _process_one_file(config_path, table, raw_file, output_override):
+    """Worker-process entry point for converting a single raw file.
 
-                self.logger.info(f"Wrote {total_rows} row(s) in {batch_num} batch(es) in {format_time(elapsed)}")
+    Module-level so it is picklable by ProcessPoolExecutor. Reconstructs an
+    Administrator from the config (workers each pay the setup cost once per
+    submitted file) and runs the per-file pipeline.
 
-                self.num_files += 1
-                self.num_batches += batch_num
-                self.num_rows += total_rows
-                self.sum_file_seconds += elapsed
+    Args:
+        config_path (str): path to the config file.
+        table (str): name of the table being processed.
+        raw_file: RawFileInfo for the file to convert.
+        output_override (Optional[str]): optional output directory override.
 
-            if self.aggregate:
-                self.logger.info(
-                    f"Wrote {self.num_rows} row(s) in {self.num_batches} batch(es) to {writer.output_path}"
-                )
-                writer.close()
+    Returns:
+        Tuple[int, int, float]: (total_rows, batch_num, elapsed_seconds) for this file.
+    """
 
-        run_elapsed = time.perf_counter() - run_t0
-        avg_per_batch = (self.sum_file_seconds / self.num_batches) if self.num_batches else 0.0
-        avg_per_file = (self.sum_file_seconds / self.num_files) if self.num_files else 0.0
-        self.logger.debug(
-            f"Timing summary: files={self.num_files}, batches={self.num_batches}, rows={self.num_rows}, "
-            f"total={format_time(run_elapsed)}, avg_per_batch={format_time(avg_per_batch)}, avg_per_file={format_time(avg_per_file)}"
-        )
\ No newline at end of file
+    logger = logging.getLogger(__name__)
+    administrator = Administrator(logger, config_path, table, output_override=output_override)
+    return administrator._convert_single_file(raw_file)
\ No newline at end of file
@@ -3,11 +3,6 @@ from typing import Any, Generator, Optional
 
 from parquet_converter.core.types import Batch
 
-"""
-TODO:
-    - Implement "header" methods
-"""
-
 
 class BaseReader(ABC):
     """This is the abstract base class for all readers.
@@ -40,15 +35,20 @@ class BaseReader(ABC):
         self.filters = filters
 
     @abstractmethod
-    def open(self, file_path: str, **kwargs) -> Any:
-        """Opens the file and returns a file handler.
+    def open(self, file_path: str, **kwargs) -> tuple:
+        """Opens the file and returns a (file handler, temp dir) pair.
+
+        All readers share this return shape so callers can unpack without
+        per-file type checks; readers that need no scratch space return None
+        for the temp dir.
 
         Args:
             file_path (str): path to the file to open.
             **kwargs: additional keyword arguments for file opening.
 
         Returns:
-            Any: backend-specific file handler object.
+            tuple: (file_handler, temp_dir) where file_handler is the
+            backend-specific handler and temp_dir is a TemporaryDirectory or None.
         """
 
         pass
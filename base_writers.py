@@ -1,3 +1,4 @@
+import os
 from abc import ABC, abstractmethod
 from typing import Any, Optional
 
@@ -13,23 +14,37 @@ class BaseWriter(ABC):
 
     All writers use a temporary file strategy: data is written to a .tmp file during
     processing and atomically moved to the final path on successful completion. This
-    prevents partial/corrupted files from being created if processing fails.
+    prevents partial/corrupted files from being created if processing fails. On Linux,
+    writers may opt into O_TMPFILE instead, which writes to an unnamed inode in the
+    output directory and publishes it with linkat on close — no visible temp name,
+    no rename.
 
     Attributes:
         kwargs (dict[str, Any]): Backend-specific keyword arguments passed to the
             underlying write functions.
         output_path (str): Final destination path for the output file.
         tmp_output_path (str): Temporary path where data is written during processing.
+            With O_TMPFILE this is a /proc/self/fd path for the unnamed inode.
         schema (Any): Backend-specific schema object defining the structure and types
             of data to be written.
         writer (Optional[Any]): Backend-specific writer instance.
     """
 
-    def __init__(self, kwargs: Optional[dict[str, Any]], output_path: str, schema: Any) -> None:
+    def __init__(
+        self,
+        kwargs: Optional[dict[str, Any]],
+        output_path: str,
+        schema: Any,
+        use_otmpfile: bool = False,
+        use_exclusive_create: bool = False,
+    ) -> None:
         """Initializes the writer with output configuration.
 
         Sets up the writer with the destination path, schema, and any backend-specific
-        options. Creates the temporary output path by appending ".tmp" to the final path.
+        options. By default the temporary output path is the final path with ".tmp"
+        appended; with use_otmpfile on a supporting platform/filesystem, an unnamed
+        file is opened in the output directory instead and tmp_output_path points at
+        its /proc/self/fd entry.
 
         Args:
             kwargs (Optional[dict[str, Any]]): Optional dictionary of keyword arguments
@@ -39,14 +54,121 @@ class BaseWriter(ABC):
                 directory must exist or be created before writing.
             schema (Any): Backend-specific schema object defining the structure and types
                 of the output data. Type depends on the backend.
+            use_otmpfile (bool): When True, write through an O_TMPFILE descriptor and
+                publish atomically via linkat on close, skipping the temp-name dentry
+                create and the rename. Silently falls back to the ".tmp" strategy when
+                the platform or filesystem does not support it.
+            use_exclusive_create (bool): When True and the target does not yet exist,
+                claim the final path with O_CREAT|O_EXCL and write straight to it,
+                skipping the rename entirely. A crash mid-write can leave a partial
+                file at the final path, so only enable where downstream consumers
+                tolerate that (ex: reruns that overwrite). Falls back to ".tmp" +
+                rename when the target already exists. Ignored when use_otmpfile is
+                active.
         """
 
-        self.kwargs = kwargs if kwargs else {}
+        self.kwargs = dict(kwargs) if kwargs else {}
         self.output_path: str = output_path
-        self.tmp_output_path: str = self.output_path + ".tmp"
         self.schema: Any = schema
         self.writer: Optional[Any] = None
 
+        self._tmp_fd: Optional[int] = None
+        if use_otmpfile and hasattr(os, "O_TMPFILE"):
+            try:
+                self._tmp_fd = os.open(os.path.dirname(output_path) or ".", os.O_TMPFILE | os.O_WRONLY, 0o644)
+            except OSError:
+                # Filesystem (or kernel) without O_TMPFILE support
+                self._tmp_fd = None
+        if self._tmp_fd is not None:
+            self.tmp_output_path: str = f"/proc/self/fd/{self._tmp_fd}"
+        elif use_exclusive_create and self._claim_exclusive():
+            # We created the final path ourselves, so nobody else could have
+            # been reading it; write directly and skip the rename
+            self.tmp_output_path = self.output_path
+        else:
+            self.tmp_output_path = self.output_path + ".tmp"
+
+    def _claim_exclusive(self) -> bool:
+        """Tries to claim the final output path with O_CREAT|O_EXCL.
+
+        Returns:
+            bool: True if the path did not exist and was created (the probe
+                descriptor is closed immediately; backends reopen by path),
+                False if the target already exists or cannot be claimed.
+        """
+
+        try:
+            os.close(os.open(self.output_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644))
+            return True
+        except OSError:
+            return False
+
+    def _publish(self) -> None:
+        """Publishes the temporary output under the final path.
+
+        With an O_TMPFILE descriptor this links the unnamed inode into the directory
+        (replacing an existing file if present) and closes the descriptor; if the
+        link itself fails (linkat can be refused on overlayfs or hardened kernels
+        even though the O_TMPFILE open succeeded), the inode contents are copied to
+        the final path instead so the written output is never lost. Otherwise it
+        falls back to os.replace of the ".tmp" file. Subclasses should call this
+        from close() after the backend writer has been finalized.
+        """
+
+        if self._tmp_fd is not None:
+            try:
+                try:
+                    try:
+                        os.link(self.tmp_output_path, self.output_path)
+                    except FileExistsError:
+                        os.unlink(self.output_path)
+                        os.link(self.tmp_output_path, self.output_path)
+                except OSError:
+                    self._copy_tmp_to_output()
+            finally:
+                os.close(self._tmp_fd)
+                self._tmp_fd = None
+        elif self.tmp_output_path != self.output_path and os.path.exists(self.tmp_output_path):
+            os.replace(self.tmp_output_path, self.output_path)
+
+    def _copy_tmp_to_output(self) -> None:
+        """Copies the unnamed O_TMPFILE inode's contents to the final path.
+
+        Last-resort publish when linkat is refused: the write descriptor is
+        O_WRONLY, so the inode is reopened readable through its /proc/self/fd
+        entry and drained to the destination with in-kernel sendfile — the data
+        never crosses into userspace.
+        """
+
+        src_fd = os.open(self.tmp_output_path, os.O_RDONLY)
+        try:
+            dst_fd = os.open(self.output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                size = os.fstat(src_fd).st_size
+                offset = 0
+                while offset < size:
+                    sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+
+    def add_file_metadata(self, metadata: dict[str, str]) -> None:
+        """Attaches key/value metadata to the output file, if the format supports it.
+
+        Used for per-file constants (ex: source file name, knowledge time) so that
+        consumers can read them from file metadata without scanning data columns.
+        The default implementation is a no-op for formats without metadata support.
+
+        Args:
+            metadata (dict[str, str]): String key/value pairs to attach.
+        """
+
+        pass
+
     @abstractmethod
     def write_table(self, batch: Batch) -> None:
         """Writes a batch of data to the output file.
@@ -2,7 +2,15 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import yaml
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+# Prefer the libyaml C parser/emitter when available; it is an order of
+# magnitude faster than the pure-Python loader and dominates startup time for
+# configs with many tables. Installs without libyaml fall back transparently.
+try:
+    from yaml import CSafeDumper as _SafeDumper, CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper, SafeLoader as _SafeLoader
 
 
 class ExtractVarConfig(BaseModel):
@@ -18,6 +26,8 @@ class ExtractVarConfig(BaseModel):
             value from the filename pattern.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid", populate_by_name=True)
+
     dtype: str = "string"
     regex_group: int
 
@@ -33,6 +43,8 @@ class MetadataKnowledgeTimeConfig(BaseModel):
         tz (str): timezone for the knowledge time. Default is 'UTC'.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid", populate_by_name=True)
+
     from_: str = Field(alias="from")
     tz: str = "UTC"
     header_line: Optional[int] = 1
@@ -57,6 +69,8 @@ class AdditionalMetadataFieldConfig(BaseModel):
         func_kwargs (Optional[Dict[str, Any]]): keyword arguments for the function.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid", populate_by_name=True)
+
     source: str
     dtype: str
     func: Optional[str] = None
@@ -79,6 +93,8 @@ class MetadataConfig(BaseModel):
             metadata columns.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid", populate_by_name=True)
+
     standard_metadata: bool = True
     knowledge_time: Optional[MetadataKnowledgeTimeConfig] = None
     additional_metadata: Optional[Dict[str, AdditionalMetadataFieldConfig]] = None
@@ -101,6 +117,8 @@ class InputConfig(BaseModel):
         options (Optional[Dict[str, Any]]): reader-specific options.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid", populate_by_name=True)
+
     reader: str = "pyarrow_reader.PyArrowCsvReader"
     file_type: str = "date"
     encoding: Optional[str] = None
@@ -126,14 +144,20 @@ class OutputConfig(BaseModel):
         metadata (MetadataConfig): configuration for metadata columns to add.
         writer_kwargs (Optional[Dict[str, Any]]): additional keyword arguments
             passed to the writer.
+        workers (int): number of worker processes for per-file parallelism in
+            non-aggregate mode. Default is 1 (sequential). Aggregate mode always
+            runs sequentially since it shares a single writer.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid", populate_by_name=True)
+
     writer: str = "pyarrow_writers.PyArrowParquetWriter"
     adjuster: str = "metadata_adjusters.StandardMetadataAdjuster"
     basedir: str
     file_template: str
     metadata: MetadataConfig = Field(default_factory=MetadataConfig)
     writer_kwargs: Optional[Dict[str, Any]] = None
+    workers: int = 1
 
 
 class ManifestConfig(BaseModel):
@@ -150,6 +174,8 @@ class ManifestConfig(BaseModel):
             auto-generating manifests (not yet implemented). Default is 20.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid", populate_by_name=True)
+
     file_template: str
     auto_detect_sample_size: Optional[int] = 20
 
@@ -170,6 +196,8 @@ class TableConfig(BaseModel):
             template.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid", populate_by_name=True)
+
     raw_files: List[str]
     aggregate: bool = False
     output_file_template: Optional[str] = None
@@ -195,6 +223,8 @@ class Config(BaseModel):
             from filenames.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid", populate_by_name=True)
+
     administrator: Optional[str] = "base_administrators.ParquetConverterAdministrator"
     input: InputConfig
     output: OutputConfig
@@ -236,12 +266,13 @@ class Config(BaseModel):
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
         with open(path, "r") as f:
-            config_dict = yaml.safe_load(f)
+            config_dict = yaml.load(f, Loader=_SafeLoader)
 
         if config_dict is None:
             raise ValueError(f"Configuration file is empty: {config_path}")
 
-        return cls(**config_dict)
+        # model_validate skips the kwargs-unpacking path of cls(**config_dict)
+        return cls.model_validate(config_dict)
 
     def to_yaml(self, output_path: str | Path) -> None:
         """Saves configuration to a YAML file.
@@ -257,11 +288,13 @@ class Config(BaseModel):
         # Create parent directories if they don't exist
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Convert to dict and handle aliases
-        config_dict = self.model_dump(by_alias=True, exclude_none=True)
+        # Convert to dict and handle aliases; mode="json" pre-stringifies
+        # non-primitive values (ex: Path) so the C dumper never falls back to
+        # Python representers
+        config_dict = self.model_dump(by_alias=True, exclude_none=True, mode="json")
 
         with open(path, "w") as f:
-            yaml.dump(config_dict, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(config_dict, f, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False)
 
     @classmethod
     def generate_template(cls, output_path: str | Path) -> "Config":
@@ -321,3 +354,24 @@ class Config(BaseModel):
             available_tables = ", ".join(self.tables.keys())
             raise KeyError(f"Table '{table_name}' not found in configuration. " f"Available tables: {available_tables}")
         return self.tables[table_name]
+
+
+# Build Pydantic core schemas eagerly at import time. Long-running processes
+# (watchers, repeated from_yaml calls) then pay only validation cost on each
+# load rather than first-call schema construction.
+for _model in (
+    ExtractVarConfig,
+    MetadataKnowledgeTimeConfig,
+    AdditionalMetadataFieldConfig,
+    MetadataConfig,
+    InputConfig,
+    OutputConfig,
+    ManifestConfig,
+    TableConfig,
+    Config,
+):
+    _model.model_rebuild()
+del _model
+
+# Prime the cached JSON schema dict so the first caller doesn't build it
+Config.model_json_schema()
@@ -1,12 +1,36 @@
 import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
 
 import pendulum
 
-from parquet_converter.adjusters.metadata_adjusters import StandardMetadataAdjuster
+from parquet_converter.adjusters.metadata_adjusters import _UTC, StandardMetadataAdjuster
 from parquet_converter.utils.config import MetadataConfig
+from parquet_converter.utils.file_utils import open_file_header_bytes
 from parquet_converter.utils.finder import RawFileInfo
 
 
+@lru_cache(maxsize=64)
+def _compile_pattern(pattern: str) -> "re.Pattern[bytes]":
+    """Compiles a header pattern to a bytes regex, cached per pattern string.
+
+    Bypasses re's internal bounded cache (which re-hashes the key on every
+    search call) so repeated per-file extractions reuse one compiled object,
+    shared across all adjuster instances.
+    """
+
+    return re.compile(pattern.encode())
+
+
+@lru_cache(maxsize=16)
+def _timezone(name: str) -> pendulum.tz.Timezone:
+    """Returns a pendulum timezone, cached per name to skip tz-database lookups."""
+
+    return pendulum.timezone(name)
+
+
 class CsvHeaderKnowledgeTimeAdjuster(StandardMetadataAdjuster):
     """Generic metadata adjuster that extracts knowledge_time from CSV header using configurable pattern.
 
@@ -19,10 +43,22 @@ class CsvHeaderKnowledgeTimeAdjuster(StandardMetadataAdjuster):
 
     Attributes:
         metadata_config (MetadataConfig): config for metadata handling.
-        _datetime_cache (dict): internal cache mapping file paths to extracted pendulum
+        _datetime_cache (OrderedDict): internal LRU cache (capped at
+            _DATETIME_CACHE_MAX entries) mapping file paths to extracted pendulum
             DateTime objects to avoid re-reading files.
     """
 
+    __slots__ = ("_datetime_cache",)
+
+    # Chunk size for the binary header scan; headers live in the first few KiB,
+    # so one read usually covers the target line.
+    _HEADER_CHUNK_BYTES = 8192
+
+    # Cap on cached per-file timestamps. Batches of one file arrive together,
+    # so an LRU this size never misses in practice while keeping memory flat
+    # on runs over hundreds of thousands of files.
+    _DATETIME_CACHE_MAX = 4096
+
     def __init__(self, metadata_config: MetadataConfig) -> None:
         """Initializes the metadata adjuster with caching.
 
@@ -31,7 +67,7 @@ class CsvHeaderKnowledgeTimeAdjuster(StandardMetadataAdjuster):
                 timezone handling, header line number, and extraction pattern.
         """
         super().__init__(metadata_config)
-        self._datetime_cache = {}
+        self._datetime_cache = OrderedDict()
 
     def get_knowledge_time(self, raw_file: RawFileInfo) -> pendulum.DateTime:
         """Extracts knowledge_time from the file's header using configured pattern.
@@ -51,8 +87,10 @@ class CsvHeaderKnowledgeTimeAdjuster(StandardMetadataAdjuster):
         """
         file_path = raw_file.full_file_path
 
-        if file_path in self._datetime_cache:
-            return self._datetime_cache[file_path]
+        cached = self._datetime_cache.get(file_path)
+        if cached is not None:
+            self._datetime_cache.move_to_end(file_path)
+            return cached
 
         # Validate config
         if not self.metadata_config.knowledge_time:
@@ -61,39 +99,139 @@ class CsvHeaderKnowledgeTimeAdjuster(StandardMetadataAdjuster):
         if not self.metadata_config.knowledge_time.header_pattern:
             raise ValueError("header_pattern is required in knowledge_time config for csv_header extraction")
 
+        result = self._extract_knowledge_time(file_path)
+        self._datetime_cache[file_path] = result
+        if len(self._datetime_cache) > self._DATETIME_CACHE_MAX:
+            self._datetime_cache.popitem(last=False)
+        return result
+
+    def prefetch_headers(self, file_paths: list[str], max_workers: int = 16) -> None:
+        """Warms the timestamp cache for many files by reading headers concurrently.
+
+        Header extraction is syscall-latency bound (one open + small read per
+        file); overlapping those across a small thread pool amortizes the
+        per-file latency when thousands of files are queued. Extraction errors
+        are deliberately swallowed here so they surface with full context from
+        get_knowledge_time when the file is actually converted.
+
+        Args:
+            file_paths (list[str]): paths whose headers should be pre-read.
+            max_workers (int): upper bound on concurrent header reads.
+        """
+
+        if not self.metadata_config.knowledge_time or not self.metadata_config.knowledge_time.header_pattern:
+            return
+
+        pending = [p for p in file_paths if p not in self._datetime_cache]
+        if len(pending) < 2:
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(pending)), thread_name_prefix="header-prefetch"
+        ) as pool:
+            futures = {pool.submit(self._extract_knowledge_time, path): path for path in pending}
+            for future, path in futures.items():
+                try:
+                    result = future.result()
+                except Exception:
+                    continue
+                self._datetime_cache[path] = result
+                if len(self._datetime_cache) > self._DATETIME_CACHE_MAX:
+                    self._datetime_cache.popitem(last=False)
+
+    def _extract_knowledge_time(self, file_path: str) -> pendulum.DateTime:
+        """Reads and parses the header timestamp for one file (no caching).
+
+        Timezone-naive header timestamps are interpreted in the configured
+        knowledge_time tz (both parse branches); offset-carrying timestamps
+        keep their own offset.
+
+        Args:
+            file_path (str): path to the file to extract from.
+
+        Returns:
+            pendulum.DateTime: the extracted timestamp converted to UTC.
+
+        Raises:
+            RuntimeError: if reading, matching, or parsing fails.
+        """
+
         header_line_num = self.metadata_config.knowledge_time.header_line or 1
         pattern = self.metadata_config.knowledge_time.header_pattern
         tz = self.metadata_config.knowledge_time.tz
 
         try:
-            # Read the specified line from the file
-            with open(file_path, "r") as f:
-                for i, line in enumerate(f, start=1):
-                    if i == header_line_num:
-                        target_line = line.strip()
-                        break
-                else:
-                    raise ValueError(f"File has fewer than {header_line_num} lines: {file_path}")
-
-            # Extract datetime using pattern
-            match = re.search(pattern, target_line)
-
-            if match:
-                dt_str = match.group(1)
-                dt = pendulum.parse(dt_str, strict=False)
+            # Read just the target line in binary mode; no text decoding or
+            # universal-newline handling for the rest of the file
+            target_line = self._read_header_line(file_path, header_line_num)
 
-                # Apply timezone if naive
-                if dt.timezone_name is None:
-                    dt = dt.replace(tzinfo=pendulum.timezone(tz))
+            # Extract datetime using a shared compiled bytes pattern
+            match = _compile_pattern(pattern).search(target_line)
 
-                result = dt.in_timezone("UTC")
-                self._datetime_cache[file_path] = result
-                return result
+            if match:
+                dt_str = match.group(1).decode("ascii", "replace")
+
+                try:
+                    # The stdlib C parser covers common ISO-8601 headers several
+                    # times faster than pendulum's parser; fall back for the
+                    # looser formats pendulum accepts with strict=False
+                    parsed = datetime.fromisoformat(dt_str)
+                    if parsed.tzinfo is None:
+                        parsed = parsed.replace(tzinfo=_timezone(tz))
+                    dt = pendulum.instance(parsed)
+                except ValueError:
+                    # tz= attaches the configured zone only when the string
+                    # carries no offset, matching the fast path; pendulum's
+                    # default would silently assume UTC for naive headers
+                    dt = pendulum.parse(dt_str, strict=False, tz=_timezone(tz))
+
+                return dt.in_timezone(_UTC)
             else:
                 raise ValueError(
                     f"Pattern '{pattern}' not found in line {header_line_num} of {file_path}. "
-                    f"Line content: {target_line}"
+                    f"Line content: {target_line.decode('ascii', 'replace')}"
                 )
 
         except Exception as e:
-            raise RuntimeError(f"Failed to extract knowledge_time from {file_path}: {e}") from e
\ No newline at end of file
+            raise RuntimeError(f"Failed to extract knowledge_time from {file_path}: {e}") from e
+
+    @classmethod
+    def _read_header_line(cls, file_path: str, header_line_num: int) -> bytes:
+        """Reads the Nth line of a file in binary mode without decoding the rest.
+
+        Pulls leading (decompressed) bytes via open_file_header_bytes, so only
+        the first few KiB are read — and for gzip/bz2/xz files only enough
+        input is decompressed to cover the target line, never the whole file.
+        The buffer is regrown geometrically in the rare case the target line
+        falls outside the initial chunk.
+
+        Args:
+            file_path (str): path to the file to read.
+            header_line_num (int): 1-based line number to return.
+
+        Returns:
+            bytes: the target line with surrounding whitespace stripped.
+
+        Raises:
+            ValueError: if the file has fewer than header_line_num lines.
+        """
+
+        max_bytes = cls._HEADER_CHUNK_BYTES
+        while True:
+            buf = open_file_header_bytes(file_path, max_bytes)
+            if not buf:
+                raise ValueError(f"File has fewer than {header_line_num} lines: {file_path}")
+            lines = buf.split(b"\n")
+
+            # More pieces than the target index means the target line was
+            # terminated by a newline inside the buffer
+            if len(lines) > header_line_num:
+                return lines[header_line_num - 1].strip()
+
+            if len(buf) < max_bytes:
+                # EOF is inside the buffer; the last (unterminated) piece counts
+                if len(lines) >= header_line_num:
+                    return lines[header_line_num - 1].strip()
+                raise ValueError(f"File has fewer than {header_line_num} lines: {file_path}")
+
+            max_bytes *= 2
\ No newline at end of file
@@ -1,8 +1,62 @@
+import calendar
 import datetime as dt
+import fnmatch
+import functools
 import glob
 import os
 import re
+import threading
 import zipfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_fnmatch(pattern):
+    """Compiles an fnmatch pattern to a regex, cached per pattern string."""
+
+    return re.compile(fnmatch.translate(pattern))
+
+
+# Parsed zip central directories, shared across finder instances and keyed by
+# (path, mtime_ns, size) so a changed archive never serves stale entries.
+# Bounded LRU; guarded by a lock since archives are scanned on a thread pool.
+_ZIPINFO_CACHE = OrderedDict()
+_ZIPINFO_CACHE_MAX = 256
+_zipinfo_cache_lock = threading.Lock()
+
+
+def _cached_zip_infolist(zip_path, stat):
+    """Returns the archive's ZipInfo list, re-parsing only when it changed.
+
+    Parsing the central directory of a large archive costs tens of
+    milliseconds; repeated scans of an unchanged archive (multiple finders,
+    repeated find_all calls) are reduced to the stat the caller already paid.
+
+    Args:
+        zip_path (str): path to the zip archive.
+        stat (os.stat_result): current stat of the archive, used as the
+            revalidation key.
+
+    Returns:
+        list: ZipInfo objects for all members of the archive.
+    """
+
+    key = (zip_path, stat.st_mtime_ns, stat.st_size)
+    with _zipinfo_cache_lock:
+        zip_infos = _ZIPINFO_CACHE.get(key)
+        if zip_infos is not None:
+            _ZIPINFO_CACHE.move_to_end(key)
+            return zip_infos
+
+    with zipfile.ZipFile(zip_path, "r") as zip_ref:
+        zip_infos = zip_ref.infolist()
+
+    with _zipinfo_cache_lock:
+        _ZIPINFO_CACHE[key] = zip_infos
+        if len(_ZIPINFO_CACHE) > _ZIPINFO_CACHE_MAX:
+            _ZIPINFO_CACHE.popitem(last=False)
+    return zip_infos
 
 
 class RawFileInfo:
@@ -32,6 +86,22 @@ class RawFileInfo:
         d (str): The primary date/delta string for this file.
     """
 
+    # One instance per discovered file; slots drop the per-instance __dict__,
+    # which matters when a finder returns tens of thousands of results
+    __slots__ = (
+        "full_file_path",
+        "full_file_name",
+        "is_zip",
+        "extract_vars",
+        "d_formater",
+        "meta_data",
+        "file_type",
+        "creation_time",
+        "file_name",
+        "member_name",
+        "d",
+    )
+
     def __init__(
         self,
         full_file_path,
@@ -41,7 +111,7 @@ class RawFileInfo:
         meta_data,
         file_type,
         d,
-        creation_time=dt.datetime.now(dt.timezone.utc),
+        creation_time=None,
     ):
         """Initializes a RawFileInfo object.
 
@@ -53,27 +123,35 @@ class RawFileInfo:
             meta_data (dict): File metadata.
             file_type (str): Pattern type.
             d (str): Primary date/delta identifier for this file.
-            creation_time (datetime.datetime): UTC timestamp of creation.
+            creation_time (datetime.datetime): UTC timestamp of creation. Defaults
+                to the current time; callers processing many files should pass one
+                shared timestamp instead.
         """
 
         self.full_file_path = full_file_path
-        self.full_file_name = full_file_path.split("/")[-1]
         self.is_zip = is_zip
         self.extract_vars = extract_vars
         self.d_formater = d_formater
         self.meta_data = meta_data
         self.file_type = file_type
-        self.creation_time = creation_time
+        # A datetime.now default argument would be evaluated once at import and
+        # shared by every instance; resolve the fallback per call instead
+        self.creation_time = creation_time if creation_time is not None else dt.datetime.now(dt.timezone.utc)
+
+        self.d = d
 
+        # Tail components via rpartition/partition: one tuple each instead of
+        # throwaway list allocations, applied once per discovered file
+        _, _, tail = full_file_path.rpartition("/")
+        self.full_file_name = tail
         if is_zip:
-            self.file_name = self.full_file_name.split("|")[0]
-            self.member_name = self.full_file_name.split("|")[1]
+            file_name, sep, member_name = tail.partition("|")
+            self.file_name = file_name
+            self.member_name = member_name if sep else None
         else:
-            self.file_name = self.full_file_name
+            self.file_name = tail
             self.member_name = None
 
-        self.d = d
-
     def __str__(self):
         """Returns a formatted string representation of the file info.
 
@@ -137,6 +215,15 @@ class FileFinder:
         self.file_type = file_type
         self.is_zip = "|" in file_template
 
+        # Precomputed range bounds so per-file filtering avoids re-converting
+        # the same values N times: delta comparisons need ints, while the
+        # fixed-width YYYYMMDD/YYYYMM digit strings order lexicographically
+        # and compare directly against the extracted d string
+        self._before_int = int(before) if before is not None else None
+        self._after_int = int(after) if after is not None else None
+        self._before_str = str(before) if before is not None else None
+        self._after_str = str(after) if after is not None else None
+
         ## Validate search_params
         ## ========================================
         # Get all formatters from file_template
@@ -170,6 +257,22 @@ class FileFinder:
         self.glob_template = self._template_to_glob()
         self.regex_template, self.member_regex_template = self._template_to_regex()
 
+        # Compile the per-file extraction patterns once. process_raw_files
+        # matches them against every discovered path (and every zip member),
+        # so rebuilding the pattern strings and recompiling per file would
+        # redo the same work N times for N files.
+        # Directory-listing cache for the cached glob walker, keyed by dir
+        # path -> (dir mtime, entries). See _cached_listdir.
+        self._scandir_cache = {}
+
+        self._d_formater_compiled, self._d_formater_found_patterns = self._build_d_formater_regex()
+        if self.is_zip:
+            self._vars_compiled = re.compile(self.regex_template + r"\|" + self.member_regex_template)
+            self._member_re = re.compile(self.member_regex_template)
+        else:
+            self._vars_compiled = re.compile(self.regex_template)
+            self._member_re = None
+
     def __str__(self):
         """Returns a formatted string representation of the finder configuration.
 
@@ -228,65 +331,118 @@ class FileFinder:
 
         return glob_pattern
 
+    # Non-capturing substitutions for {KEY} placeholders in _template_to_regex.
+    # These must stay group-free so extract_vars regex_group indices line up
+    # with the user's own parenthesized groups.
+    _PLACEHOLDER_REGEX_MAPPING = {
+        "YYYY": "[0-9]{4}",
+        "MM": "[0-9]{2}",
+        "DD": "[0-9]{2}",
+        "YYYYMMDD": "[0-9]{8}",
+        "YYYYMM": "[0-9]{6}",
+        "YYMMDD": "[0-9]{6}",
+        "YYMM": "[0-9]{4}",
+        "YY": "[0-9]{2}",
+        "hh": "[0-9]{2}",
+        "mm": "[0-9]{2}",
+        "ss": "[0-9]{2}",
+        "ms": "[0-9]{3}",
+        "us": "[0-9]{6}",
+        "delta": "[0-9]+",
+    }
+
     def _template_to_regex(self):
         """Converts a template pattern to regex pattern(s) for metadata extraction.
 
-        Replaces date/time placeholders with regex patterns and converts glob wildcards
-        to regex equivalents. For zip files, returns separate patterns for the archive
-        and member.
+        Tokenizes the template on {KEY} placeholders so only the literal segments
+        are escaped: regex metacharacters (+ [ ] ^ $ . and friends) become
+        literals instead of silently changing the pattern's meaning. The
+        template's own syntax survives escaping — parenthesized capture groups
+        (extract_vars indexes into them) pass through as raw regex and the glob
+        wildcards * and ? become .* and . — and placeholders are substituted
+        with non-capturing digit patterns. For zip files, returns separate
+        patterns for the archive and member.
 
         Returns:
             tuple: (archive_regex, member_regex) where member_regex is None for regular files.
         """
 
-        def _to_regex(s):
+        placeholder_regex = re.compile(r"\{(\w+)\}")
+        group_regex = re.compile(r"\([^)]*\)")
+
+        def _escape_plain(text):
+            # Escape regex metachars, then restore the glob wildcards * and ?
+            return re.escape(text).replace(r"\*", ".*").replace(r"\?", ".")
+
+        def _escape_literal(part):
+            # Parenthesized runs are user-supplied capture-group regex
+            # (extract_vars indexes into them) and pass through untouched;
+            # everything around them is escaped as literal text
+            pieces = []
+            last_end = 0
+            for group in group_regex.finditer(part):
+                pieces.append(_escape_plain(part[last_end : group.start()]))
+                pieces.append(group.group(0))
+                last_end = group.end()
+            pieces.append(_escape_plain(part[last_end:]))
+            return "".join(pieces)
 
-            # replace glob wildcards with regex wildcards
-            s = s.replace(".", r"\.").replace("*", ".*").replace("?", ".")
-
-            # format the date and delta with regex patterns
-            s = s.format(
-                YYYY="[0-9]{4}",
-                MM="[0-9]{2}",
-                DD="[0-9]{2}",
-                YYYYMMDD="[0-9]{8}",
-                YYYYMM="[0-9]{6}",
-                YYMMDD="[0-9]{6}",
-                YYMM="[0-9]{4}",
-                YY="[0-9]{2}",
-                hh="[0-9]{2}",
-                mm="[0-9]{2}",
-                ss="[0-9]{2}",
-                ms="[0-9]{3}",
-                us="[0-9]{6}",
-                delta="[0-9]+",
-                **{k: ".*" for k in self.search_params.keys()},
-            )
-
-            return s
+        def _to_regex(s):
+            # split with a capture group alternates literal segments (even
+            # indices) with placeholder keys (odd indices)
+            pieces = []
+            for i, part in enumerate(placeholder_regex.split(s)):
+                if i % 2:
+                    # search_params values match anything; date/delta keys get
+                    # their digit patterns
+                    pieces.append(self._PLACEHOLDER_REGEX_MAPPING.get(part, ".*"))
+                else:
+                    pieces.append(_escape_literal(part))
+            return "".join(pieces)
 
         if self.is_zip:
             # split by member
-            file = self.file_template.split("|")[0]
-            member = self.file_template.split("|")[1]
+            file, _, member = self.file_template.partition("|")
 
             return _to_regex(file), _to_regex(member)
 
         else:
             return _to_regex(self.file_template), None
 
-    def _extract_d_formater(self, file_path):
-        """Extracts all date/time format components from a file path.
-
-        Matches the file path against the template pattern and extracts date/time
-        components (YYYY, MM, DD, etc.). Derives missing composite formats from
-        component parts and vice versa.
-
-        Args:
-            file_path (str): Complete file path to extract from.
+    # Regex for locating date/delta placeholders in a template
+    _D_PATTERN_REGEX = r"\{(YYYYMMDD|YYYYMM|YYMMDD|YYMM|YYYY|MM|DD|YY|hh|mm|ss|ms|us|delta)\}"
+
+    # Key order of the d_formater result dict
+    _D_KEYS = ("YYYY", "MM", "DD", "YYYYMM", "YY", "YYMM", "YYMMDD", "YYYYMMDD", "hh", "mm", "ss", "ms", "us", "delta")
+
+    # Regex patterns (one capture group each) for each date/delta type
+    _D_REGEX_MAPPING = {
+        "YYYYMMDD": "([0-9]{8})",
+        "YYYYMM": "([0-9]{6})",
+        "YYMMDD": "([0-9]{6})",
+        "YYMM": "([0-9]{4})",
+        "YYYY": "([0-9]{4})",
+        "MM": "([0-9]{2})",
+        "DD": "([0-9]{2})",
+        "YY": "([0-9]{2})",
+        "hh": "([0-9]{2})",
+        "mm": "([0-9]{2})",
+        "ss": "([0-9]{2})",
+        "ms": "([0-9]{3})",
+        "us": "([0-9]{6})",
+        "delta": "([0-9]+)",
+    }
+
+    def _build_d_formater_regex(self):
+        """Builds the compiled date-component pattern for this template.
+
+        Performs the template-to-regex conversion (strip parentheses, escape
+        literals, convert glob wildcards, substitute search_params, substitute
+        date placeholders with capture groups) once, at construction.
 
         Returns:
-            dict: Dictionary with keys for all date/time formats.
+            tuple: (re.Pattern, list[str]) — the compiled pattern and the
+                ordered list of placeholder names its groups capture.
         """
 
         # Step 1: Remove parentheses and apply regex patterns
@@ -302,126 +458,105 @@ class FileFinder:
             regex_pattern = regex_pattern.replace(key_str, v)
 
         # Step 2: Find key patterns
-        pattern_regex = r"\{(YYYYMMDD|YYYYMM|YYMMDD|YYMM|YYYY|MM|DD|YY|hh|mm|ss|ms|us|delta)\}"
-        found_patterns = re.findall(pattern_regex, regex_pattern)
-
-        # Define regex patterns for each date/delta type
-        regex_mapping = {
-            "YYYYMMDD": "([0-9]{8})",
-            "YYYYMM": "([0-9]{6})",
-            "YYMMDD": "([0-9]{6})",
-            "YYMM": "([0-9]{4})",
-            "YYYY": "([0-9]{4})",
-            "MM": "([0-9]{2})",
-            "DD": "([0-9]{2})",
-            "YY": "([0-9]{2})",
-            "hh": "([0-9]{2})",
-            "mm": "([0-9]{2})",
-            "ss": "([0-9]{2})",
-            "ms": "([0-9]{3})",
-            "us": "([0-9]{6})",
-            "delta": "([0-9]+)",
-        }
+        found_patterns = re.findall(self._D_PATTERN_REGEX, regex_pattern)
 
-        # Replace each pattern with its regex equivalent
+        # Step 3: Replace each pattern with its regex equivalent
         for pattern_type in found_patterns:
             pattern_placeholder = "{" + pattern_type + "}"
-            regex_pattern = regex_pattern.replace(pattern_placeholder, regex_mapping[pattern_type], 1)
-
-        # Step 4: Match the regex against the filename
-        match = re.match(regex_pattern, file_path)
+            regex_pattern = regex_pattern.replace(pattern_placeholder, self._D_REGEX_MAPPING[pattern_type], 1)
 
-        if not match:
-            # Return default structure with all None values
-            return {
-                "YYYY": None,
-                "MM": None,
-                "DD": None,
-                "YYYYMM": None,
-                "YY": None,
-                "YYMM": None,
-                "YYMMDD": None,
-                "YYYYMMDD": None,
-                "hh": None,
-                "mm": None,
-                "ss": None,
-                "ms": None,
-                "us": None,
-                "delta": None,
-            }
-
-        # Step 5: Extract captured groups and map them to pattern types
-        captured_values = {}
-        for i, pattern_type in enumerate(found_patterns):
-            value = match.group(i + 1)
-            captured_values[pattern_type] = value
-
-        # Step 6: Build result with captured values
-        result = {
-            "YYYY": None,
-            "MM": None,
-            "DD": None,
-            "YYYYMM": None,
-            "YY": None,
-            "YYMM": None,
-            "YYMMDD": None,
-            "YYYYMMDD": None,
-            "hh": None,
-            "mm": None,
-            "ss": None,
-            "ms": None,
-            "us": None,
-            "delta": None,
-        }
+        return re.compile(regex_pattern), found_patterns
 
-        # Copy directly captured values
-        for key in captured_values:
-            result[key] = captured_values[key]
+    def _extract_d_formater(self, file_path):
+        """Extracts all date/time format components from a file path.
 
-        # Step 7: Derived missing date formats from whatever we extracted
-        # Extract individual components from composite formats
-        if result["YYYYMMDD"] and not all([result["YYYY"], result["MM"], result["DD"]]):
-            result["YYYY"] = result["YYYYMMDD"][:4]
-            result["MM"] = result["YYYYMMDD"][4:6]
-            result["DD"] = result["YYYYMMDD"][6:8]
+        Matches the file path against the precompiled template pattern and extracts
+        date/time components (YYYY, MM, DD, etc.). Derives missing composite formats
+        from component parts and vice versa.
 
-        if result["YYYYMM"] and not all([result["YYYY"], result["MM"]]):
-            result["YYYY"] = result["YYYYMM"][:4]
-            result["MM"] = result["YYYYMM"][4:6]
+        Args:
+            file_path (str): Complete file path to extract from.
 
-        if result["YYMMDD"] and not all([result["YY"], result["MM"], result["DD"]]):
-            result["YY"] = result["YYMMDD"][:2]
-            result["MM"] = result["YYMMDD"][2:4]
-            result["DD"] = result["YYMMDD"][4:6]
+        Returns:
+            dict: Dictionary with keys for all date/time formats.
+        """
 
-        if result["YYMM"] and not all([result["YY"], result["MM"]]):
-            result["YY"] = result["YYMM"][:2]
-            result["MM"] = result["YYMM"][2:4]
+        # Match the precompiled regex against the filename
+        match = self._d_formater_compiled.match(file_path)
 
-        # Convert YY to YYYY if we have YY but not YYYY
-        if result["YY"] and not result["YYYY"]:
-            result["YYYY"] = str(dt.datetime.strptime(result["YY"], "%y").year)
+        if not match:
+            # Return default structure with all None values
+            return dict.fromkeys(self._D_KEYS)
+
+        # Map captured groups to their placeholder types. Parentheses are
+        # stripped during pattern construction, so the groups line up 1:1
+        # with the found placeholders.
+        captured = dict(zip(self._d_formater_found_patterns, match.groups()))
+
+        yyyymmdd = captured.get("YYYYMMDD")
+        yyyymm = captured.get("YYYYMM")
+        yymmdd = captured.get("YYMMDD")
+        yymm = captured.get("YYMM")
+        yyyy = captured.get("YYYY")
+        yy = captured.get("YY")
+        month = captured.get("MM")
+        day = captured.get("DD")
+
+        # Derive individual components from composite formats (straight-line
+        # locals instead of repeated dict reads and all([...]) allocations)
+        if yyyymmdd and not (yyyy and month and day):
+            yyyy, month, day = yyyymmdd[:4], yyyymmdd[4:6], yyyymmdd[6:8]
+
+        if yyyymm and not (yyyy and month):
+            yyyy, month = yyyymm[:4], yyyymm[4:6]
+
+        if yymmdd and not (yy and month and day):
+            yy, month, day = yymmdd[:2], yymmdd[2:4], yymmdd[4:6]
+
+        if yymm and not (yy and month):
+            yy, month = yymm[:2], yymm[2:4]
+
+        # Convert YY to YYYY using strptime's pivot rule (<=68 -> 20YY,
+        # else 19YY) without paying for a strptime call per file
+        if yy and not yyyy:
+            yy_int = int(yy)
+            yyyy = str(2000 + yy_int if yy_int <= 68 else 1900 + yy_int)
 
         # Convert YYYY to YY if we have YYYY but not YY
-        if result["YYYY"] and not result["YY"]:
-            result["YY"] = result["YYYY"][2:4]
+        if yyyy and not yy:
+            yy = yyyy[2:4]
 
         # Build composite formats from individual components
-        if result["YYYY"] and result["MM"] and result["DD"] and not result["YYYYMMDD"]:
-            result["YYYYMMDD"] = result["YYYY"] + result["MM"] + result["DD"]
-
-        if result["YYYY"] and result["MM"] and not result["YYYYMM"]:
-            result["YYYYMM"] = result["YYYY"] + result["MM"]
-
-        if result["YY"] and result["MM"] and result["DD"] and not result["YYMMDD"]:
-            result["YYMMDD"] = result["YY"] + result["MM"] + result["DD"]
-
-        if result["YY"] and result["MM"] and not result["YYMM"]:
-            result["YYMM"] = result["YY"] + result["MM"]
-
-        return result
+        if yyyy and month and day and not yyyymmdd:
+            yyyymmdd = yyyy + month + day
+
+        if yyyy and month and not yyyymm:
+            yyyymm = yyyy + month
+
+        if yy and month and day and not yymmdd:
+            yymmdd = yy + month + day
+
+        if yy and month and not yymm:
+            yymm = yy + month
+
+        return {
+            "YYYY": yyyy,
+            "MM": month,
+            "DD": day,
+            "YYYYMM": yyyymm,
+            "YY": yy,
+            "YYMM": yymm,
+            "YYMMDD": yymmdd,
+            "YYYYMMDD": yyyymmdd,
+            "hh": captured.get("hh"),
+            "mm": captured.get("mm"),
+            "ss": captured.get("ss"),
+            "ms": captured.get("ms"),
+            "us": captured.get("us"),
+            "delta": captured.get("delta"),
+        }
 
-    def _extract_metadata(self, file_path):
+    def _extract_metadata(self, file_path, zinfo=None, zfile_stats=None, stat=None):
         """Extracts file system metadata from a file path.
 
         Gets file size, modification time, and for zip files, both archive and
@@ -429,6 +564,13 @@ class FileFinder:
 
         Args:
             file_path (str): Complete file path. For zip files, format is "zip_path|member".
+            zinfo (Optional[zipfile.ZipInfo]): pre-fetched member info from an
+                already-open archive; when provided the zip is not re-opened.
+            zfile_stats (Optional[tuple]): pre-computed (zfile_name, zfile_mtime,
+                zfile_size) for the archive, stat'd once per archive by the caller.
+            stat (Optional[os.stat_result]): pre-fetched stat for a regular file
+                (ex: from the scandir-backed walker); when provided the two
+                path-based stat calls are skipped.
 
         Returns:
             dict: Dictionary with keys: file_path, file_name, file_mtime, file_size,
@@ -436,11 +578,13 @@ class FileFinder:
         """
 
         if not self.is_zip:
+            if stat is None:
+                stat = os.stat(file_path)
             return {
                 "file_path": file_path,
                 "file_name": os.path.basename(file_path),
-                "file_mtime": dt.datetime.fromtimestamp(os.path.getmtime(file_path), dt.timezone.utc),
-                "file_size": os.path.getsize(file_path),
+                "file_mtime": dt.datetime.fromtimestamp(stat.st_mtime, dt.timezone.utc),
+                "file_size": stat.st_size,
                 "zfile_name": None,
                 "zfile_mtime": None,
                 "zfile_size": None,
@@ -448,11 +592,22 @@ class FileFinder:
             }
 
         else:
-            zfile_path = file_path.split("|")[0]
-            mfile_name = file_path.split("|")[1]
-            zfile_name = os.path.basename(zfile_path)
-            with zipfile.ZipFile(zfile_path, "r") as zip_ref:
-                mfile_info = zip_ref.getinfo(mfile_name)
+            zfile_path, _, mfile_name = file_path.partition("|")
+
+            # Only re-open the archive when the caller couldn't hand us the info
+            mfile_info = zinfo
+            if mfile_info is None:
+                with zipfile.ZipFile(zfile_path, "r") as zip_ref:
+                    mfile_info = zip_ref.getinfo(mfile_name)
+
+            if zfile_stats is not None:
+                zfile_name, zfile_mtime, zfile_size = zfile_stats
+            else:
+                # One stat covers both fields in the fallback path
+                zstat = os.stat(zfile_path)
+                zfile_name = os.path.basename(zfile_path)
+                zfile_mtime = dt.datetime.fromtimestamp(zstat.st_mtime, dt.timezone.utc)
+                zfile_size = zstat.st_size
 
             return {
                 "file_path": file_path,
@@ -462,8 +617,8 @@ class FileFinder:
                 ),  # NOTE: file_mtime does NOT have timezone due to the way zip files store mtime
                 "file_size": mfile_info.file_size,
                 "zfile_name": zfile_name,
-                "zfile_mtime": dt.datetime.fromtimestamp(os.path.getmtime(zfile_path), dt.timezone.utc),
-                "zfile_size": os.path.getsize(zfile_path),
+                "zfile_mtime": zfile_mtime,
+                "zfile_size": zfile_size,
                 "zfile_compress_size": mfile_info.compress_size,
             }
 
@@ -480,14 +635,12 @@ class FileFinder:
             dict: Dictionary mapping variable names to their extracted and cast values.
         """
 
-        # Determine which regex template to use
-        if self.is_zip:
-            regex_pattern = self.regex_template + r"\|" + self.member_regex_template
-        else:
-            regex_pattern = self.regex_template
+        # Nothing configured to capture: skip the per-file regex match entirely
+        if not self.extract_vars:
+            return {}
 
-        # Match the file path against the regex pattern
-        match = re.match(regex_pattern, file_path)
+        # Match the file path against the precompiled regex pattern
+        match = self._vars_compiled.match(file_path)
 
         # If no match found, return empty dictionary
         if not match:
@@ -525,19 +678,23 @@ class FileFinder:
 
         return result
 
-    def _process_single_file(self, file_path, creation_time):
+    def _process_single_file(self, file_path, creation_time, zinfo=None, zfile_stats=None, stat=None):
         """Processes a single file path and creates a RawFileInfo object if it matches.
 
         Args:
             file_path (str): Complete file path to process. For zip files, format is "zip_path|member".
             creation_time (datetime.datetime): Creation timestamp to use for the RawFileInfo.
+            zinfo (Optional[zipfile.ZipInfo]): pre-fetched member info, forwarded
+                to _extract_metadata to avoid re-opening the archive.
+            zfile_stats (Optional[tuple]): pre-computed archive stats, forwarded
+                to _extract_metadata.
+            stat (Optional[os.stat_result]): pre-fetched stat for a regular file,
+                forwarded to _extract_metadata.
 
         Returns:
             RawFileInfo or None: RawFileInfo object if file matches pattern, None otherwise.
         """
         d_formater_dict = self._extract_d_formater(file_path)
-        metadata_dict = self._extract_metadata(file_path)
-        extract_vars_dict = self._extract_vars(file_path)
 
         if self.file_type == "date":
             d = d_formater_dict["YYYYMMDD"]
@@ -548,16 +705,30 @@ class FileFinder:
         else:
             d = None
 
+        # ensure in range before paying for any stat/zip central-directory
+        # work; out-of-range files are rejected on the regex match alone
+        if d is not None:
+            if self.file_type == "delta":
+                # Deltas are variable-width, so compare as ints
+                d_int = int(d)
+                if self._before_int is not None and d_int >= self._before_int:
+                    return None
+                if self._after_int is not None and d_int <= self._after_int:
+                    return None
+            else:
+                # Fixed-width date strings compare lexicographically; no int
+                # conversions per file
+                if self._before_str is not None and d >= self._before_str:
+                    return None
+                if self._after_str is not None and d <= self._after_str:
+                    return None
+
+        metadata_dict = self._extract_metadata(file_path, zinfo=zinfo, zfile_stats=zfile_stats, stat=stat)
+        extract_vars_dict = self._extract_vars(file_path)
+
         for search_param_item, search_param_value in self.search_params.items():
             extract_vars_dict[search_param_item] = search_param_value
 
-        # ensure in range
-        if d is not None:
-            if self.before is not None and int(d) >= int(self.before):
-                return None
-            if self.after is not None and int(d) <= int(self.after):
-                return None
-
         return RawFileInfo(
             file_path,
             self.is_zip,
@@ -577,36 +748,94 @@ class FileFinder:
         Filters files based on before/after date ranges if configured.
 
         Args:
-            all_f (list): List of file paths to process.
+            all_f (list): List of file paths, or (path, os.stat_result) pairs
+                from the cached walker, to process.
 
         Returns:
             list: List of RawFileInfo objects for all matching files.
         """
 
-        found_files = list()
+        return list(self.iter_raw_files(all_f))
+
+    def iter_raw_files(self, all_f):
+        """Lazily yields RawFileInfo objects for the given file paths.
+
+        Streaming counterpart of process_raw_files: consumers that only read
+        sequentially avoid materializing the full discovery list.
+
+        Args:
+            all_f (list): List of file paths, or (path, os.stat_result) pairs
+                from the cached walker, to process.
+
+        Yields:
+            RawFileInfo: one object per matching file.
+        """
+
         creation_time = dt.datetime.now(dt.timezone.utc)
 
-        # loop through all files
-        for raw_file in all_f:
-            # must process slightly differently for zip files
-            if self.is_zip:
-                with zipfile.ZipFile(raw_file, "r") as zip_ref:
-                    # List all files in the zip
-                    zip_members = zip_ref.namelist()
-
-                # Check each member against the member regex pattern
-                for member in zip_members:
-                    if re.match(self.member_regex_template, member):
-                        # This member matches the pattern
-                        member_file_path = f"{raw_file}|{member}"
-                        file_info = self._process_single_file(member_file_path, creation_time)
-                        if file_info is not None:
-                            found_files.append(file_info)
+        # Normalize to (path, stat) pairs; plain paths carry no stat and fall
+        # back to stat-on-demand in _extract_metadata
+        all_f = [raw_file if isinstance(raw_file, tuple) else (raw_file, None) for raw_file in all_f]
 
+        # must process slightly differently for zip files
+        if self.is_zip:
+            # Each archive open seeks to and reads the central directory — an
+            # I/O stall that releases the GIL — so scanning archives on a
+            # thread pool overlaps those stalls. Results are yielded in
+            # submission order to keep output deterministic.
+            if len(all_f) > 1:
+                max_workers = min(32, (os.cpu_count() or 1) * 4, len(all_f))
+                with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="zip-scan") as pool:
+                    futures = [
+                        pool.submit(self._process_zip_archive, raw_path, creation_time, stat=raw_stat)
+                        for raw_path, raw_stat in all_f
+                    ]
+                    for future in futures:
+                        yield from future.result()
             else:
-                file_info = self._process_single_file(raw_file, creation_time)
+                for raw_path, raw_stat in all_f:
+                    yield from self._process_zip_archive(raw_path, creation_time, stat=raw_stat)
+
+        else:
+            for raw_path, raw_stat in all_f:
+                file_info = self._process_single_file(raw_path, creation_time, stat=raw_stat)
                 if file_info is not None:
-                    found_files.append(file_info)
+                    yield file_info
+
+    def _process_zip_archive(self, raw_file, creation_time, stat=None):
+        """Processes all matching members of a single zip archive.
+
+        Opens the archive at most once: the central directory comes from the
+        module-level stat-revalidated cache and each member's ZipInfo plus the
+        archive stats are handed down instead of re-opening per member.
+
+        Args:
+            raw_file (str): path to the zip archive.
+            creation_time (datetime.datetime): creation timestamp for RawFileInfos.
+            stat (Optional[os.stat_result]): pre-fetched stat for the archive.
+
+        Returns:
+            list: RawFileInfo objects for all matching members.
+        """
+
+        found_files = list()
+        if stat is None:
+            stat = os.stat(raw_file)
+        zip_infos = _cached_zip_infolist(raw_file, stat)
+        zfile_stats = (
+            os.path.basename(raw_file),
+            dt.datetime.fromtimestamp(stat.st_mtime, dt.timezone.utc),
+            stat.st_size,
+        )
+
+        # Filter members against the precompiled pattern first; the
+        # bound-method comprehension keeps the hot filter loop in C
+        matcher = self._member_re.match
+        for zinfo in [i for i in zip_infos if matcher(i.filename)]:
+            member_file_path = f"{raw_file}|{zinfo.filename}"
+            file_info = self._process_single_file(member_file_path, creation_time, zinfo=zinfo, zfile_stats=zfile_stats)
+            if file_info is not None:
+                found_files.append(file_info)
 
         return found_files
 
@@ -614,18 +843,201 @@ class FileFinder:
         """Finds all files matching the template pattern.
 
         If before/after ranges are configured, uses find_range(). Otherwise,
-        uses glob to find all matching files.
+        expands the glob template through the scandir-backed cached walker,
+        which filters each directory with one compiled pattern and hands the
+        stat results it already fetched to process_raw_files — cheaper than
+        glob.glob's per-entry fnmatch calls on large directories.
 
         Returns:
             list: List of RawFileInfo objects for all discovered files.
         """
 
+        return list(self.iter_all())
+
+    def iter_all(self):
+        """Lazily yields all files matching the template pattern.
+
+        Streaming counterpart of find_all for consumers that read
+        sequentially; peak memory stays flat instead of O(N) in the number of
+        discovered files.
+
+        Yields:
+            RawFileInfo: one object per discovered file.
+        """
+
         if self.before and self.after:
-            return self.find_range(self.before, self.after)
+            yield from self.iter_range(self.after, self.before)
+            return
+
+        yield from self.iter_raw_files(self._glob_with_cache(self.glob_template))
 
-        all_f = glob.glob(self.glob_template)
+    def _cached_listdir(self, dir_path):
+        """Lists a directory via os.scandir with mtime-validated caching.
 
-        return self.process_raw_files(all_f)
+        Repeated find_range iterations re-walk the same parent directories for
+        every date; each listing is cached and revalidated with a single stat
+        of the directory mtime, so an unchanged directory is scanned once per
+        finder instead of once per date.
+
+        Args:
+            dir_path (str): directory to list.
+
+        Returns:
+            list: (name, is_dir, stat_result) tuples, empty if the directory
+                cannot be read.
+        """
+
+        try:
+            dir_mtime = os.stat(dir_path).st_mtime
+        except OSError:
+            return []
+
+        cached = self._scandir_cache.get(dir_path)
+        if cached is not None and cached[0] == dir_mtime:
+            return cached[1]
+
+        entries = []
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    try:
+                        entry_stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((entry.name, entry.is_dir(), entry_stat))
+        except OSError:
+            entries = []
+
+        self._scandir_cache[dir_path] = (dir_mtime, entries)
+        return entries
+
+    def _glob_with_cache(self, pattern):
+        """Expands a glob pattern using cached directory listings.
+
+        Walks the pattern segment by segment: literal segments are joined
+        without touching the filesystem, wildcard segments are matched against
+        cached os.scandir listings with a compiled fnmatch regex. Matches
+        glob.glob semantics (hidden entries only match patterns that start
+        with a dot) but re-lists each unchanged directory at most once per
+        finder and returns the stat results scandir already fetched.
+
+        Args:
+            pattern (str): glob pattern to expand.
+
+        Returns:
+            list: (path, stat_result) tuples for matching entries.
+        """
+
+        if not glob.has_magic(pattern):
+            try:
+                return [(pattern, os.stat(pattern))]
+            except OSError:
+                return []
+
+        sep = os.sep
+        head = sep if pattern.startswith(sep) else ""
+        parts = [part for part in pattern.split(sep) if part]
+        bases = [head]
+
+        for i, part in enumerate(parts):
+            last = i == len(parts) - 1
+
+            if not glob.has_magic(part):
+                bases = [os.path.join(base, part) if base else part for base in bases]
+                if last:
+                    matches = []
+                    for base in bases:
+                        try:
+                            matches.append((base, os.stat(base)))
+                        except OSError:
+                            pass
+                    return matches
+                continue
+
+            matcher = _compile_fnmatch(part).match
+            skip_hidden = not part.startswith(".")
+            next_bases = []
+            matches = []
+            for base in bases:
+                for name, is_dir, entry_stat in self._cached_listdir(base or "."):
+                    if skip_hidden and name.startswith("."):
+                        continue
+                    if not matcher(name):
+                        continue
+                    full = os.path.join(base, name) if base else name
+                    if last:
+                        matches.append((full, entry_stat))
+                    elif is_dir:
+                        next_bases.append(full)
+
+            if last:
+                return matches
+            bases = next_bases
+            if not bases:
+                return []
+
+        return []
+
+    # Glob wildcard substitutions for placeholders left unpinned by find_range
+    _RANGE_WILDCARD_SUBS = {
+        "YYYY": "????",
+        "MM": "??",
+        "DD": "??",
+        "YYYYMMDD": "????????",
+        "YYYYMM": "??????",
+        "YYMMDD": "??????",
+        "YYMM": "??????",
+        "YY": "??",
+        "hh": "??",
+        "mm": "??",
+        "ss": "??",
+        "ms": "???",
+        "us": "??????",
+        "delta": "*",
+    }
+
+    # Placeholders pinned per iteration by the date/month range loop
+    _RANGE_DATE_KEYS = frozenset(("YYYY", "MM", "DD", "YYYYMMDD", "YYYYMM", "YYMMDD", "YYMM", "YY"))
+
+    def _compile_range_formatter(self, file_template, varying_keys, static_subs):
+        """Precompiles a template into a join-based formatter for find_range.
+
+        str.format re-parses the whole template and all fourteen keyword
+        substitutions on every loop iteration, though only a few placeholders
+        actually vary. Tokenize once: static placeholders (wildcards and
+        search_params) are folded into merged literal runs, and each iteration
+        reduces to a dict lookup per varying placeholder plus one join.
+
+        Args:
+            file_template (str): template with {KEY} placeholders.
+            varying_keys (frozenset): placeholder names substituted per iteration.
+            static_subs (dict): substitutions folded in once for everything else.
+
+        Returns:
+            callable: formatter taking a dict of varying-key values and
+                returning the formatted string.
+        """
+
+        segments = []
+        literal = []
+        for i, piece in enumerate(re.split(r"\{(\w+)\}", file_template)):
+            if i % 2 and piece in varying_keys:
+                if literal:
+                    segments.append((False, "".join(literal)))
+                    literal = []
+                segments.append((True, piece))
+            elif i % 2:
+                literal.append(static_subs[piece] if piece in static_subs else str(self.search_params[piece]))
+            else:
+                literal.append(piece)
+        if literal:
+            segments.append((False, "".join(literal)))
+        segments = tuple(segments)
+
+        def formatter(values):
+            return "".join(values[text] if is_key else text for is_key, text in segments)
+
+        return formatter
 
     def find_range(self, after, before):
         """Finds files within a specific range.
@@ -642,7 +1054,22 @@ class FileFinder:
             list: List of RawFileInfo objects for all files in the range.
         """
 
-        found_files = list()
+        return list(self.iter_range(after, before))
+
+    def iter_range(self, after, before):
+        """Lazily yields files within a specific range.
+
+        Streaming counterpart of find_range: each date's matches are yielded
+        as they are discovered, so sequential consumers never hold the whole
+        range in memory.
+
+        Args:
+            after (str): Start date/delta/month.
+            before (str): End date/delta/month.
+
+        Yields:
+            RawFileInfo: one object per file in the range.
+        """
 
         # remove member file
         file_template = self.file_template.split("|")[0]
@@ -658,64 +1085,67 @@ class FileFinder:
                 start = dt.datetime.strptime(after + "01", "%Y%m%d")
                 end = dt.datetime.strptime(before + "01", "%Y%m%d")
 
-            current = start
-            while current <= end:
-
-                curr_glob_template = file_template.format(
-                    YYYY=current.strftime("%Y"),
-                    MM=current.strftime("%m"),
-                    DD=current.strftime("%d"),
-                    YYYYMMDD=current.strftime("%Y%m%d"),
-                    YYYYMM=current.strftime("%Y%m"),
-                    YYMMDD=current.strftime("%y%m%d"),
-                    YYMM=current.strftime("%y%m"),
-                    YY=current.strftime("%y"),
-                    hh="??",
-                    mm="??",
-                    ss="??",
-                    ms="???",
-                    us="??????",
-                    delta="*",
-                    **self.search_params,
+            formatter = self._compile_range_formatter(file_template, self._RANGE_DATE_KEYS, self._RANGE_WILDCARD_SUBS)
+
+            # Step the date as plain integers and format with f-strings; the
+            # strftime round trips through locale-aware C code seven times per
+            # day, which adds up over multi-year ranges
+            y, m, d = start.year, start.month, start.day
+            end_key = (end.year, end.month, end.day)
+            while (y, m, d) <= end_key:
+                yyyy = f"{y:04d}"
+                mm_str = f"{m:02d}"
+                dd = f"{d:02d}"
+                yy = f"{y % 100:02d}"
+
+                curr_glob_template = formatter(
+                    {
+                        "YYYY": yyyy,
+                        "MM": mm_str,
+                        "DD": dd,
+                        "YYYYMMDD": yyyy + mm_str + dd,
+                        "YYYYMM": yyyy + mm_str,
+                        "YYMMDD": yy + mm_str + dd,
+                        "YYMM": yy + mm_str,
+                        "YY": yy,
+                    }
                 )
-                all_f = glob.glob(curr_glob_template)
+                # (path, stat) pairs from the walker flow through so
+                # _extract_metadata reuses the stats scandir already fetched
+                all_f = self._glob_with_cache(curr_glob_template)
 
-                found_files.extend(self.process_raw_files(all_f))
+                yield from self.iter_raw_files(all_f)
 
                 if self.file_type == "date":
-                    current += dt.timedelta(days=1)
+                    if d < calendar.monthrange(y, m)[1]:
+                        d += 1
+                    elif m < 12:
+                        m += 1
+                        d = 1
+                    else:
+                        y += 1
+                        m = 1
+                        d = 1
                 else:
-                    if current.month < 12:
-                        current = current.replace(month=current.month + 1)
+                    if m < 12:
+                        m += 1
                     else:
-                        current = current.replace(year=current.year + 1, month=1)
+                        y += 1
+                        m = 1
 
         # delta files
         else:
             start = int(after)
             end = int(before)
 
-            for d in range(start, end + 1):
-                curr_glob_template = file_template = file_template.format(
-                    YYYY="????",
-                    MM="??",
-                    DD="??",
-                    YYYYMMDD="????????",
-                    YYYYMM="??????",
-                    YYMMDD="??????",
-                    YYMM="??????",
-                    YY="??",
-                    hh="??",
-                    mm="??",
-                    ss="??",
-                    ms="???",
-                    us="??????",
-                    delta=d,
-                    **self.search_params,
-                )
+            # Everything except delta is folded into the formatter once
+            formatter = self._compile_range_formatter(file_template, frozenset(("delta",)), self._RANGE_WILDCARD_SUBS)
 
-                all_f = glob.glob(curr_glob_template)
+            for d in range(start, end + 1):
+                curr_glob_template = formatter({"delta": str(d)})
 
-                found_files.extend(self.process_raw_files(all_f))
+                # (path, stat) pairs from the walker flow through so
+                # _extract_metadata reuses the stats scandir already fetched
+                all_f = self._glob_with_cache(curr_glob_template)
 
-        return found_files
+                yield from self.iter_raw_files(all_f)
@@ -1,6 +1,7 @@
-import os
-import subprocess
+import io
+import mmap
 import tempfile
+from collections import deque
 from typing import Any, BinaryIO, Generator, Optional
 
 import pyarrow
@@ -8,15 +9,19 @@ import pyarrow.csv as pcsv
 
 from parquet_converter.backends.pyarrow_backend import PyArrowBatch
 from parquet_converter.readers.pyarrow_readers import PyArrowCsvReader
+from parquet_converter.utils.file_utils import advise_sequential
 
 
 class GeneralizedCsvReader(PyArrowCsvReader):
     """Generalized CSV reader with support for skipfooter via preprocessing.
-    
-    When skipfooter > 0, uses Unix `head` command to efficiently remove footer
-    rows without loading the entire file into memory. The preprocessed content
-    is written to a temporary file, which is then streamed by PyArrow.
-    
+
+    When skipfooter > 0, the footer is trimmed in-process: plain files are
+    mmapped and scanned backwards for the cutoff newline so PyArrow parses a
+    zero-copy slice, while compressed/non-seekable handles are streamed once
+    through a bounded last-N-lines buffer into a spooled sink that stays in
+    memory up to one block and spills to a disk temp file beyond that. No
+    child process is involved either way.
+
     Attributes:
         skipfooter (int): Number of rows to skip from the end of the file. Default is 0.
     """
@@ -30,7 +35,7 @@ class GeneralizedCsvReader(PyArrowCsvReader):
         
         Args:
             skipfooter (int): Number of rows to skip from end of file. Default is 0.
-                When skipfooter > 0, uses subprocess to efficiently remove footer rows.
+                When skipfooter > 0, footer rows are trimmed in-process before parsing.
             **kwargs: Additional arguments passed to PyArrowCsvReader:
                 - kwargs: Backend-specific keyword arguments for PyArrow
                 - filters: Optional filter expressions (not yet implemented)
@@ -65,50 +70,66 @@ class GeneralizedCsvReader(PyArrowCsvReader):
         self.skipfooter = skipfooter
     
     def batch_read(
-        self, file_handler: BinaryIO, schema: Optional[Any] = None, **kwargs
+        self,
+        file_handler: BinaryIO,
+        schema: Optional[Any] = None,
+        max_bytes: Optional[int] = None,
+        skip_footer_handling: bool = False,
+        **kwargs
     ) -> Generator[PyArrowBatch, None, None]:
         """Reads a CSV file and yields data in batches.
-        
+
         When skipfooter=0, uses standard streaming batch reading for memory efficiency.
-        When skipfooter>0, preprocesses the file using Unix tools to remove footer rows,
-        then streams the cleaned file.
-        
+        When skipfooter>0, trims the footer rows in-process and streams the
+        remaining bytes.
+
         Args:
             file_handler (BinaryIO): File handler from open() method (binary mode).
             schema (Optional[Any]): Optional PyArrow schema for type enforcement and
                 validation during reading.
+            max_bytes (Optional[int]): Overrides the read block size for callers
+                that only need the first batch (ex: schema inference).
+            skip_footer_handling (bool): Bypasses the footer trim and streams
+                directly; safe when only leading rows matter.
             **kwargs: Additional keyword arguments (currently unused).
-            
+
         Yields:
             PyArrowBatch: PyArrowBatch instances containing portions of the CSV data.
                 Each batch represents approximately block_size bytes of data.
         """
         # If no footer to skip, use standard streaming approach
-        if self.skipfooter == 0:
-            yield from self._stream_read(file_handler, schema)
+        if self.skipfooter == 0 or skip_footer_handling:
+            yield from self._stream_read(file_handler, schema, max_bytes=max_bytes)
             return
-        
-        # If skipfooter > 0, preprocess with Unix tools
+
+        # If skipfooter > 0, trim the footer in-process
         yield from self._read_with_preprocessing(file_handler, schema)
-    
+
     def _stream_read(
-        self, file_handler: BinaryIO, schema: Optional[Any] = None
+        self, file_handler: BinaryIO, schema: Optional[Any] = None, max_bytes: Optional[int] = None
     ) -> Generator[PyArrowBatch, None, None]:
         """Standard streaming batch read without footer handling.
-        
+
         This is the most memory-efficient approach, reading data in chunks without
         loading the entire file into memory.
-        
+
         Args:
             file_handler (BinaryIO): File handler to read from.
             schema (Optional[Any]): Optional PyArrow schema for type enforcement.
-            
+            max_bytes (Optional[int]): Overrides the read block size; see batch_read.
+
         Yields:
             PyArrowBatch: Batches of data.
         """
+        # One-shot scan: ask the kernel for aggressive readahead
+        advise_sequential(file_handler)
+
         # Build ReadOptions
         read_options_dict = self.options.get("read_options", {})
-        if "block_size" not in read_options_dict:
+        if max_bytes is not None:
+            read_options_dict = dict(read_options_dict)
+            read_options_dict["block_size"] = max_bytes
+        elif "block_size" not in read_options_dict:
             read_options_dict["block_size"] = self.block_size
         read_options = pcsv.ReadOptions(**read_options_dict)
         
@@ -136,7 +157,7 @@ class GeneralizedCsvReader(PyArrowCsvReader):
             )
             
             for batch in stream_reader:
-                table = pyarrow.Table.from_batches([batch])
+                table = pyarrow.Table.from_batches([batch], schema=batch.schema)
                 yield PyArrowBatch(table)
         finally:
             if stream_reader is not None:
@@ -145,48 +166,81 @@ class GeneralizedCsvReader(PyArrowCsvReader):
     def _read_with_preprocessing(
         self, file_handler: BinaryIO, schema: Optional[Any] = None
     ) -> Generator[PyArrowBatch, None, None]:
-        """Preprocesses file to remove footer, then streams the result.
-        
-        Uses Unix `head -n -N` command which streams efficiently without
-        loading the entire file into memory. The cleaned content is written
-        to a temporary file which is then streamed by PyArrow.
-        
+        """Trims the last skipfooter lines in-process, then streams the result.
+
+        Plain uncompressed handles are mmapped and scanned backwards from EOF
+        for the cutoff newline, so PyArrow parses a zero-copy slice of the
+        page cache — no bytes are copied, spawned through a child process, or
+        written to a temp file. Compressed and other non-seekable handles are
+        streamed once through a bounded buffer of the trailing lines into a
+        spooled sink (in-memory up to one block, disk temp file beyond, so
+        multi-GB decompressed inputs cannot exhaust memory).
+
+        If skipfooter trims away every data line, both branches yield no
+        batches rather than handing PyArrow an empty parse.
+
         Args:
             file_handler (BinaryIO): File handler to read from.
             schema (Optional[Any]): Optional PyArrow schema for type enforcement.
-            
+
         Yields:
             PyArrowBatch: Batches of data with footer rows removed.
         """
-        # Create a temporary file for the preprocessed content
-        with tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.csv') as tmp_file:
-            tmp_path = tmp_file.name
-            
+        if isinstance(file_handler, io.BufferedReader):
+            # Plain file: map it read-only and locate the cutoff offset with a
+            # backwards newline scan (rfind runs in C over the mapped pages).
+            # MAP_POPULATE prefaults the pages so neither the scan nor the
+            # parse stalls on page faults.
             try:
-                # Use head -n -N to remove last N lines (streams efficiently)
-                # Note: head reads the file in chunks, doesn't load it all into memory
-                result = subprocess.run(
-                    ['head', '-n', f'-{self.skipfooter}'],
-                    stdin=file_handler,
-                    stdout=tmp_file,
-                    check=True,
-                    stderr=subprocess.PIPE
+                mapped = mmap.mmap(
+                    file_handler.fileno(),
+                    0,
+                    flags=mmap.MAP_PRIVATE | getattr(mmap, "MAP_POPULATE", 0),
+                    prot=mmap.PROT_READ,
                 )
-                
-                # Close the temp file so we can reopen it for reading
-                tmp_file.close()
-                
-                # Now open and stream the cleaned file
-                with open(tmp_path, 'rb') as clean_file:
-                    yield from self._stream_read(clean_file, schema)
-            
-            except subprocess.CalledProcessError as e:
-                raise RuntimeError(f"Failed to preprocess file with head command: {e.stderr.decode()}") from e
-            
+            except ValueError:
+                # Empty files cannot be mapped; nothing survives the trim
+                return
+            try:
+                cutoff = len(mapped)
+                if cutoff and mapped[cutoff - 1 : cutoff] == b"\n":
+                    cutoff -= 1
+                for _ in range(self.skipfooter):
+                    cutoff = mapped.rfind(b"\n", 0, cutoff)
+                    if cutoff <= 0:
+                        # Over-trim: at most a bare newline survives
+                        return
+                # Keep the newline terminating the last surviving line; the
+                # memoryview slice makes the Arrow buffer zero-copy over the
+                # mapped pages
+                buffer = pyarrow.py_buffer(memoryview(mapped)[: cutoff + 1])
+                yield from self._stream_read(pyarrow.BufferReader(buffer), schema)
+                del buffer
             finally:
-                # Clean up temp file
-                if os.path.exists(tmp_path):
-                    os.unlink(tmp_path)
+                try:
+                    mapped.close()
+                except BufferError:
+                    # A still-referenced zero-copy slice keeps the mapping
+                    # alive; it unmaps when the last buffer is collected
+                    pass
+        else:
+            # Non-seekable (ex: gzip) stream: hold back the trailing
+            # skipfooter lines in a deque and flush everything older into a
+            # spooled sink — one pass, in-memory up to one block, spilling
+            # to an anonymous disk temp file beyond that so a multi-GB
+            # decompressed input cannot exhaust memory
+            with tempfile.SpooledTemporaryFile(max_size=self.block_size) as sink:
+                tail = deque()
+                for line in file_handler:
+                    tail.append(line)
+                    if len(tail) > self.skipfooter:
+                        sink.write(tail.popleft())
+                if not sink.tell():
+                    # Over-trim: nothing survives; match the mmap path and
+                    # yield no batches instead of raising on an empty parse
+                    return
+                sink.seek(0)
+                yield from self._stream_read(sink, schema)
 
 
 class BARRAReader(GeneralizedCsvReader):
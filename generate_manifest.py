@@ -7,14 +7,23 @@ import random
 import resource
 import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
+from functools import lru_cache
 
 import pyarrow as pa
+import pyarrow.parquet as pq
 import yaml
 
+try:
+    # libyaml-backed C parser; roughly an order of magnitude faster
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 from parquet_converter.core.ops_registry import get_ops
 from parquet_converter.core.types import LogicalType, TimestampType
-from parquet_converter.ParqConverter import Administrator
+from parquet_converter.administrators.base_administrator import Administrator
 from parquet_converter.readers.pyarrow_readers import BloombergReader, PyArrowCsvReader, PyArrowParquetReader
 from parquet_converter.utils.finder import FileFinder
 from parquet_converter.utils.manifest import Manifest
@@ -23,50 +32,56 @@ from parquet_converter.utils.manifest import Manifest
 logger = None
 
 
+# Type-id dispatch for parameter-free PyArrow types: one dict lookup replaces
+# the pa.types.is_* predicate chain (each predicate is its own Python call).
+# Parameterized types (timestamp, decimal) fall through to explicit handling.
+_ID_TO_LOGICAL = {
+    pa.string().id: LogicalType.STRING,
+    pa.large_string().id: LogicalType.STRING,
+    pa.int8().id: LogicalType.INT64,
+    pa.int16().id: LogicalType.INT64,
+    pa.int32().id: LogicalType.INT64,
+    pa.int64().id: LogicalType.INT64,
+    pa.uint8().id: LogicalType.INT64,
+    pa.uint16().id: LogicalType.INT64,
+    pa.uint32().id: LogicalType.INT64,
+    pa.uint64().id: LogicalType.INT64,
+    pa.float32().id: LogicalType.DOUBLE,
+    pa.float64().id: LogicalType.DOUBLE,
+    pa.date32().id: LogicalType.DATE32,
+    pa.date64().id: LogicalType.DATE64,
+    pa.bool_().id: LogicalType.BOOL,
+    # Null types default to STRING
+    pa.null().id: LogicalType.STRING,
+}
+
+
+@lru_cache(maxsize=256)
 def pyarrow_to_logical_type(pa_type):
     """Convert a PyArrow type to LogicalType or TimestampType.
 
+    Dispatches on the integer type id, so the common case is a single dict
+    lookup; DataType objects are hashable, so repeat columns across sample
+    files hit the cache without even that.
+
     Args:
         pa_type (pa.DataType): PyArrow type object
 
     Returns:
         LogicalType | TimestampType: LogicalType enum value or TimestampType instance
     """
-    if pa.types.is_string(pa_type) or pa.types.is_unicode(pa_type) or pa.types.is_large_string(pa_type):
-        return LogicalType.STRING
-    elif (
-        pa.types.is_int64(pa_type)
-        or pa.types.is_int32(pa_type)
-        or pa.types.is_int16(pa_type)
-        or pa.types.is_int8(pa_type)
-    ):
-        return LogicalType.INT64
-    elif (
-        pa.types.is_uint64(pa_type)
-        or pa.types.is_uint32(pa_type)
-        or pa.types.is_uint16(pa_type)
-        or pa.types.is_uint8(pa_type)
-    ):
-        return LogicalType.INT64
-    elif pa.types.is_float64(pa_type) or pa.types.is_float32(pa_type) or pa.types.is_decimal(pa_type):
-        return LogicalType.DOUBLE
-    elif pa.types.is_date32(pa_type):
-        return LogicalType.DATE32
-    elif pa.types.is_date64(pa_type):
-        return LogicalType.DATE64
-    elif pa.types.is_timestamp(pa_type):
+    logical_type = _ID_TO_LOGICAL.get(pa_type.id)
+    if logical_type is not None:
+        return logical_type
+    if pa.types.is_timestamp(pa_type):
         # Extract unit and timezone from PyArrow timestamp type
         unit = str(pa_type.unit)  # 's', 'ms', 'us', 'ns'
         tz = pa_type.tz  # timezone string or None
         return TimestampType(unit=unit, tz=tz)
-    elif pa.types.is_boolean(pa_type):
-        return LogicalType.BOOL
-    elif pa.types.is_null(pa_type):
-        # Null types default to STRING
-        return LogicalType.STRING
-    else:
-        # Unknown types default to STRING
-        return LogicalType.STRING
+    if pa.types.is_decimal(pa_type):
+        return LogicalType.DOUBLE
+    # Unknown types default to STRING
+    return LogicalType.STRING
 
 
 def _arguments():
@@ -90,7 +105,7 @@ def get_config(config_path):
         dict: Loaded config dictionary
     """
     with open(config_path, "r") as f:
-        config = yaml.load(f, Loader=yaml.FullLoader)
+        config = yaml.load(f, Loader=_SafeLoader)
     return config
 
 
@@ -106,26 +121,84 @@ def get_raw_files(file_templates, extract_vars, file_type):
         list[FileInfo]: List of FileInfo objects for all matching files
     """
 
-    for file_template in file_templates:
-        finder = FileFinder(file_template, extract_vars=extract_vars, file_type=file_type)
-        all_raw_files = finder.find_all()
+    def _find_one(file_template):
+        return FileFinder(file_template, extract_vars=extract_vars, file_type=file_type).find_all()
+
+    # The old loop reassigned the result per template, silently discarding all
+    # but the last. Accumulate every template's matches; globbing is
+    # stat-latency bound, so templates are searched concurrently.
+    all_raw_files = []
+    if len(file_templates) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(file_templates)), thread_name_prefix="raw-find") as pool:
+            for found in pool.map(_find_one, file_templates):
+                all_raw_files.extend(found)
+    else:
+        for file_template in file_templates:
+            all_raw_files.extend(_find_one(file_template))
     return all_raw_files
 
 
+def iter_raw_files(file_templates, extract_vars, file_type):
+    """Lazily yields raw files matching the configured file templates.
+
+    Streaming counterpart of get_raw_files for consumers that sample or scan
+    sequentially: discovery memory stays flat instead of materializing every
+    match on large trees.
+
+    Args:
+        file_templates (list[str]): List of file path templates with variables
+        extract_vars (list[str]): Variables to extract from file paths
+        file_type (str): Type of files to find (csv, parquet, etc.)
+
+    Yields:
+        FileInfo: one object per matching file
+    """
+
+    for file_template in file_templates:
+        yield from FileFinder(file_template, extract_vars=extract_vars, file_type=file_type).iter_all()
+
+
 def get_random_sample(all_f, n):
     """
-    Filter all_f to N random samples from the list.
+    Reservoir-samples up to N items from an iterable of files.
+
+    Algorithm R keeps memory at O(n) regardless of how many files discovery
+    yields, so sampling works directly over the streaming finder without ever
+    materializing the full list.
 
     Args:
-        all_f (list): List of files to sample from
+        all_f (Iterable): Files to sample from; may be a lazy iterator
         n (int | None): Number of random samples to return
 
     Returns:
-        list: List of N random samples from all_f, or all_f if n is None or n >= len(all_f)
+        list: Up to N uniformly sampled files, or all of them if n is None or
+            fewer than n are found
     """
-    if n is None or n >= len(all_f):
-        return all_f
-    return random.sample(all_f, n)
+    if n is None:
+        return list(all_f)
+
+    reservoir = []
+    for i, item in enumerate(all_f):
+        if i < n:
+            reservoir.append(item)
+        else:
+            j = random.randint(0, i)
+            if j < n:
+                reservoir[j] = item
+    return reservoir
+
+
+# Type hierarchy from most restrictive (lowest rank) to least restrictive.
+# A module-level table keeps the per-pair merge to two dict lookups instead of
+# re-walking an elif chain; ranks below 50 are numeric, 50-59 are dates.
+_RANK = {
+    LogicalType.BOOL: 10,
+    LogicalType.INT64: 20,
+    LogicalType.DOUBLE: 40,
+    LogicalType.DATE32: 50,
+    LogicalType.DATE64: 51,
+    LogicalType.STRING: 100,
+}
 
 
 def can_cast_to_common_type(type1, type2):
@@ -139,41 +212,28 @@ def can_cast_to_common_type(type1, type2):
         LogicalType | TimestampType: Most restrictive common type that both can cast to
     """
 
-    # If types are equal, return that type
+    # If types are equal, return that type. TimestampType is a frozen
+    # dataclass, so matching unit/tz pairs are covered here too.
     if type1 == type2:
         return type1
 
-    # If both are TimestampType, try to find common type
-    if isinstance(type1, TimestampType) and isinstance(type2, TimestampType):
-        # If units and timezones match, they're the same
-        if type1.unit == type2.unit and type1.tz == type2.tz:
-            return type1
-        # Otherwise, fall back to string for incompatible timestamps
-        return LogicalType.STRING
-
-    # If one is TimestampType and the other is LogicalType, fall back to string
+    # Any remaining TimestampType pairing is incompatible (unequal timestamps,
+    # or timestamp vs plain type): fall back to string
     if isinstance(type1, TimestampType) or isinstance(type2, TimestampType):
         return LogicalType.STRING
 
-    # Get ranks
-    rank1 = get_type_hierarchy_rank(type1)
-    rank2 = get_type_hierarchy_rank(type2)
-
-    # If both are numeric, promote to the less restrictive numeric type
-    if rank1 < 50 and rank2 < 50:  # Both are numeric types
-        # Return the less restrictive type (higher rank)
-        return type1 if rank1 > rank2 else type2
+    rank1 = _RANK.get(type1, 200)
+    rank2 = _RANK.get(type2, 200)
 
-    # If both are date/timestamp types, promote to less restrictive
-    if 50 <= rank1 < 60 and 50 <= rank2 < 60:
+    # Numeric with numeric, or date with date: promote to the less
+    # restrictive of the pair (higher rank)
+    if (rank1 < 50 and rank2 < 50) or (50 <= rank1 < 60 and 50 <= rank2 < 60):
         return type1 if rank1 > rank2 else type2
 
     # If types are incompatible, fall back to string
     return LogicalType.STRING
 
 
-# Type hierarchy from most restrictive to least restrictive
-# We'll determine the strictest common type each column can be cast to
 def get_type_hierarchy_rank(logical_type):
     """Return rank for type strictness (lower = more restrictive).
 
@@ -184,25 +244,56 @@ def get_type_hierarchy_rank(logical_type):
         int: Rank value (lower = more restrictive)
     """
 
-    if logical_type == LogicalType.BOOL:
-        return 10
-    elif logical_type == LogicalType.INT64:
-        return 20
-    elif logical_type == LogicalType.DOUBLE:
-        return 40
-    elif logical_type == LogicalType.DATE32:
-        return 50
-    elif logical_type == LogicalType.DATE64:
-        return 51
-    elif logical_type == LogicalType.STRING:
-        return 100
-    else:
-        return 200
+    return _RANK.get(logical_type, 200)
+
+
+def _read_one_schema(admin, file_info):
+    """Reads the first batch of one sample file and returns its schema.
+
+    Args:
+        admin (Administrator): Administrator object with reader configuration
+        file_info (RawFileInfo): Sample file to read
+
+    Returns:
+        pa.Schema | None: Schema of the first batch, or None if the file is empty
+    """
+
+    logger.debug(f"Reading file: {file_info.full_file_path}")
+    # Readers uniformly return (handler, temp_dir)
+    file_handler, temp_dir = admin.reader.open(file_info.full_file_path, is_zip=file_info.is_zip)
+
+    try:
+        # Only the first batch is needed for the schema: a small block size
+        # keeps readers from pulling a full block per sample file, and the
+        # footer trim is skipped since trailing rows never reach the first
+        # block. Readers without these knobs ignore the kwargs.
+        batch_gen = admin.reader.batch_read(file_handler, schema=None, max_bytes=65536, skip_footer_handling=True)
+        try:
+            first_batch = next(batch_gen, None)
+        finally:
+            batch_gen.close()
+
+        if first_batch is None:
+            logger.warning(f"No data found in {file_info.full_file_path} (empty file or no batches)")
+            return None
+
+        # Get the PyArrow table from the batch using unwrap()
+        table = first_batch.unwrap()
+        logger.debug(f"Schema from {file_info.full_file_path}: {table.schema}")
+        return table.schema
+    finally:
+        # Close file handler and cleanup
+        admin.reader.close(file_handler, temp_dir=temp_dir)
 
 
 def infer_pa_schemas(admin, all_f):
     """Infer schema by reading sample files and finding strictest common type per column.
 
+    Sample files are read concurrently: each read is dominated by I/O wait and
+    PyArrow's parser releases the GIL, so a thread pool overlaps the per-file
+    latency. Results are collected in submission order, keeping the inferred
+    column ordering deterministic.
+
     Args:
         admin (Administrator): Administrator object with reader configuration
         all_f (list[FileInfo]): List of FileInfo objects to sample
@@ -211,38 +302,69 @@ def infer_pa_schemas(admin, all_f):
         dict[str, str]: Dict mapping column names to inferred type strings
     """
 
-    schemas = []
-    for file_info in all_f:
-        logger.debug(f"Reading file: {file_info.full_file_path}")
-        file_handler_result = admin.reader.open(file_info.full_file_path, is_zip=file_info.is_zip)
+    if len(all_f) > 1:
+        max_workers = min(len(all_f), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="schema-infer") as pool:
+            futures = [pool.submit(_read_one_schema, admin, file_info) for file_info in all_f]
+            schemas = [future.result() for future in futures]
+    else:
+        schemas = [_read_one_schema(admin, file_info) for file_info in all_f]
+    schemas = [schema for schema in schemas if schema is not None]
 
-        # Handle both tuple (file_handler, temp_dir) and simple file_handler returns
-        if isinstance(file_handler_result, tuple):
-            file_handler, temp_dir = file_handler_result
-        else:
-            file_handler = file_handler_result
-            temp_dir = None
+    if not schemas:
+        logger.error("No files could be read for schema inference")
+        return
 
-        try:
-            batch_gen = admin.reader.batch_read(file_handler, schema=None)
-            first_batch = next(batch_gen, None)
+    return _merge_inferred_schema(schemas)
 
-            if first_batch is None:
-                logger.warning(f"No data found in {file_info.full_file_path} (empty file or no batches)")
-                continue
 
-            # Get the PyArrow table from the batch using unwrap()
-            table = first_batch.unwrap()
-            schemas.append(table.schema)
-            logger.debug(f"Schema from {file_info.full_file_path}: {table.schema}")
-        finally:
-            # Close file handler and cleanup
-            admin.reader.close(file_handler, temp_dir=temp_dir)
+def infer_parquet_schemas(all_f):
+    """Infer schema for parquet sample files from footer metadata only.
+
+    Parquet embeds its schema in the footer, so pq.read_schema pulls a few KB
+    per file instead of decoding row groups through batch_read. Footers are
+    fetched concurrently since each read is one small seek+read.
+
+    Args:
+        all_f (list[FileInfo]): List of FileInfo objects to sample
+
+    Returns:
+        dict[str, str]: Dict mapping column names to inferred type strings
+    """
+
+    def _read_footer_schema(file_info):
+        logger.debug(f"Reading parquet footer: {file_info.full_file_path}")
+        try:
+            return pq.read_schema(file_info.full_file_path)
+        except Exception as e:
+            logger.warning(f"Could not read schema from {file_info.full_file_path}: {e}")
+            return None
+
+    if len(all_f) > 1:
+        max_workers = min(len(all_f), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="footer-read") as pool:
+            schemas = list(pool.map(_read_footer_schema, all_f))
+    else:
+        schemas = [_read_footer_schema(file_info) for file_info in all_f]
+    schemas = [schema for schema in schemas if schema is not None]
 
     if not schemas:
         logger.error("No files could be read for schema inference")
         return
 
+    return _merge_inferred_schema(schemas)
+
+
+def _merge_inferred_schema(schemas):
+    """Merges sample schemas into the strictest common type per column.
+
+    Args:
+        schemas (list[pa.Schema]): Schemas read from the sample files
+
+    Returns:
+        dict[str, str]: Dict mapping column names to inferred type strings
+    """
+
     # Step 2: Infer strictest type for each column
     # Collect all column names across all schemas, preserving order from first schema
     all_columns = list(schemas[0].names)  # Start with first schema's column order
@@ -255,29 +377,33 @@ def infer_pa_schemas(admin, all_f):
                 all_columns.append(col_name)
                 seen_columns.add(col_name)
 
-    # Step 3: Combine all schemas, choosing most restrictive type for each column
+    # Step 3: Combine all schemas, choosing most restrictive type for each column.
+    # One pass over the schemas populates every column's type list at once:
+    # schema.names is rebuilt (and linearly scanned by `in`) per lookup, so the
+    # per-column-per-schema probing was O(columns² × schemas)
+    col_types_map = {col_name: [] for col_name in all_columns}
+    for schema in schemas:
+        names = set(schema.names)
+        for col_name in all_columns:
+            if col_name in names:
+                col_types_map[col_name].append(pyarrow_to_logical_type(schema.field(col_name).type))
+            else:
+                # Column doesn't exist in this file, treat as null -> STRING
+                col_types_map[col_name].append(LogicalType.STRING)
+
     inferred_schema = {}
 
     for col_name in all_columns:
-        col_types = []
-
-        # Collect all types for this column across schemas and convert to LogicalType
-        for schema in schemas:
-            if col_name in schema.names:
-                field = schema.field(col_name)
-                logical_type = pyarrow_to_logical_type(field.type)
-                col_types.append(logical_type)
-            else:
-                # Column doesn't exist in this file, treat as null -> STRING
-                col_types.append(LogicalType.STRING)
+        col_types = col_types_map[col_name]
 
-        # Determine the strictest common type
-        if not col_types:
-            inferred_type = LogicalType.STRING
-        else:
-            inferred_type = col_types[0]
-            for next_type in col_types[1:]:
-                inferred_type = can_cast_to_common_type(inferred_type, next_type)
+        # Determine the strictest common type. STRING is the absorbing top of
+        # the lattice — once the accumulator degrades to it no later type can
+        # change the result, so bail out instead of merging the rest
+        inferred_type = col_types[0] if col_types else LogicalType.STRING
+        for next_type in col_types[1:]:
+            if inferred_type is LogicalType.STRING:
+                break
+            inferred_type = can_cast_to_common_type(inferred_type, next_type)
 
         # Store the type appropriately (LogicalType.value or TimestampType as-is)
         if isinstance(inferred_type, LogicalType):
@@ -353,14 +479,17 @@ def main():
     # atexit.register(log_on_exit, logger, start_time)
 
     admin = Administrator(logger, args.config, args.table)
-    all_f = get_random_sample(get_raw_files(admin.raw_file_templates, admin.extract_vars, admin.file_type), args.s)
+    all_f = get_random_sample(iter_raw_files(admin.raw_file_templates, admin.extract_vars, admin.file_type), args.s)
 
     for f in all_f:
         logger.debug(f"Using {f.full_file_path} sample file")
 
     logger.info(f"Found {len(all_f)} files, using {min(len(all_f), args.s)} for schema inference")
 
-    if isinstance(admin.reader, (PyArrowCsvReader, PyArrowParquetReader, BloombergReader)):
+    if isinstance(admin.reader, PyArrowParquetReader):
+        # Parquet carries its schema in the footer; no row groups are decoded
+        inferred_schema = infer_parquet_schemas(all_f)
+    elif isinstance(admin.reader, (PyArrowCsvReader, BloombergReader)):
         inferred_schema = infer_pa_schemas(admin, all_f)
     else:
         logger.error(f"Don't understand reader type {type(admin.reader)} - Please add handling for this case")
@@ -4,12 +4,16 @@ import pendulum
 
 from parquet_converter.adjusters.base_adjusters import BaseMetadataAdjuster
 from parquet_converter.core.ops_registry import get_ops
-from parquet_converter.core.types import Batch, LogicalType, TimestampType
+from parquet_converter.core.types import Batch
 from parquet_converter.utils.config import MetadataConfig
 from parquet_converter.utils.manifest import Manifest
 
 ops = get_ops()
 
+# Cached timezone singleton; pendulum.timezone/in_timezone("UTC") does a tz-database
+# lookup per call, which adds up when computing knowledge time per raw file.
+_UTC = pendulum.timezone("UTC")
+
 
 class StandardMetadataAdjuster(BaseMetadataAdjuster):
     """Our main class for computing and adding standard metadata to a batch of data.
@@ -24,11 +28,20 @@ class StandardMetadataAdjuster(BaseMetadataAdjuster):
     Attributes:
         metadata_config (MetadataConfig): an object of the MetadataConfig class. Allows us to get the specific
           preferences for the dataset at hand.
+        _additional_cooked (tuple): precomputed per-column plan for additional metadata,
+          as (name, source_kind, source_key, parsed_dtype, func, func_args, func_kwargs)
+          tuples, so add_metadata does a flat scan instead of re-parsing source strings
+          and dtype specs on every batch.
     """
 
+    __slots__ = ("_additional_cooked",)
+
     def __init__(self, metadata_config: MetadataConfig) -> None:
         """Initializes the standard metadata adjuster.
 
+        Parses each additional_metadata entry's source string and dtype spec once,
+        so unknown sources fail fast at construction rather than mid-conversion.
+
         Args:
             metadata_config (MetadataConfig): MetadataConfig object containing metadata column specifications
               and computation rules.
@@ -36,6 +49,24 @@ class StandardMetadataAdjuster(BaseMetadataAdjuster):
 
         super().__init__(metadata_config)
 
+        cooked = []
+        for column_name, field_config in (metadata_config.additional_metadata or {}).items():
+            source_kind, _, source_key = field_config.source.partition(".")
+            if source_kind not in ("extract_vars", "metadata", "column"):
+                raise ValueError(f"Unknown source: {field_config.source}")
+            cooked.append(
+                (
+                    column_name,
+                    source_kind,
+                    source_key,
+                    Manifest.parse_dtype_string(field_config.dtype),
+                    field_config.func,
+                    tuple(field_config.func_args or ()),
+                    dict(field_config.func_kwargs or {}),
+                )
+            )
+        self._additional_cooked = tuple(cooked)
+
     def get_knowledge_time(self, raw_file: Any) -> pendulum.DateTime:
         """Determines the knowledge time for a raw file.
 
@@ -58,7 +89,7 @@ class StandardMetadataAdjuster(BaseMetadataAdjuster):
         if self.metadata_config.knowledge_time is None or (
             self.metadata_config.knowledge_time is not None and self.metadata_config.knowledge_time.from_ == "file_name"
         ):
-            tz = self.metadata_config.knowledge_time.tz if self.metadata_config.knowledge_time else "UTC"
+            tz = self.metadata_config.knowledge_time.tz if self.metadata_config.knowledge_time else _UTC
 
             # gathers date/time information and formats to integers
             year = int(raw_file.d_formater["YYYY"])
@@ -82,7 +113,7 @@ class StandardMetadataAdjuster(BaseMetadataAdjuster):
             )
 
             # returns the knowledge time in UTC
-            return knowledge_time_local.in_timezone("UTC")
+            return knowledge_time_local.in_timezone(_UTC)
 
         # if we don't get the knowledge time from the file name, get it from the file mtime
         else:
@@ -96,7 +127,14 @@ class StandardMetadataAdjuster(BaseMetadataAdjuster):
         """
         pass
 
-    def add_metadata(self, batch: Batch, start_index: int, raw_file: Any) -> Batch:
+    def add_metadata(
+        self,
+        batch: Batch,
+        start_index: int,
+        raw_file: Any,
+        extra_constants: dict[str, Any] | None = None,
+        extra_schema_hints: dict[str, Any] | None = None,
+    ) -> Batch:
         """Adds the metadata columns to an individual batch of data.
 
         This method appends metadata columns to the batch, including standard columns
@@ -104,83 +142,46 @@ class StandardMetadataAdjuster(BaseMetadataAdjuster):
         metadata columns outlined in the config. For StandardMetadataAdjuster, we intentionally
         put the additional metadata columns before the standard metadata columns. Note that
         additional metadata can optionally have functions applied (ex: rounding, string
-        manipulation) before being cast to the desired dtype.
+        manipulation) before being cast to the desired dtype. Caller-supplied
+        extra_constants (ex: null fills for missing source_optional columns) are
+        appended in the same batch rebuild as the standard constants.
 
         Args:
             batch (Batch): the current batch of data that we are adding metadata to.
             start_index (int): the starting row index for this batch (for _index column).
             raw_file (Any): RawFileInfo object containing source file information.
+            extra_constants (dict[str, Any] | None): additional constant columns to append.
+            extra_schema_hints (dict[str, Any] | None): logical type hints for extra_constants.
 
         Returns:
             Batch: the batch with added metadata columns.
         """
-        # for additional metadata columns
-        if self.metadata_config.additional_metadata:
-            for column_name, field_config in self.metadata_config.additional_metadata.items():
-
-                # gets the source of the additional metadata column
-                column_source = field_config.source
-                dtype = Manifest.parse_dtype_string(field_config.dtype)
+        # for additional metadata columns; source strings and dtypes were parsed
+        # once at construction into a flat tuple (see __init__)
+        for column_name, source_kind, source_key, dtype, func, func_args, func_kwargs in self._additional_cooked:
 
-                # if the source is extract_vars...
-                if column_source.startswith("extract_vars.") or column_source.startswith("metadata."):
+            # if the source is extract_vars or metadata, add the value as a constant column
+            if source_kind == "extract_vars":
+                batch = ops.append_constant_columns(batch, {column_name: raw_file.extract_vars[source_key]})
+            elif source_kind == "metadata":
+                batch = ops.append_constant_columns(batch, {column_name: raw_file.meta_data[source_key]})
 
-                    # gets the value and dtype from the extract_var
-                    var = column_source.split(".")[1]
-                    value = (
-                        raw_file.extract_vars[var]
-                        if column_source.startswith("extract_vars.")
-                        else raw_file.meta_data[var]
-                    )
-
-                    # Create a constants dict with single value to add as column
-                    batch = ops.append_constant_columns(batch, {column_name: value})
-
-                # if the source is a column, get the column and the dtype
-                elif column_source.startswith("column."):
-                    source_col_name = column_source.split(".")[1]
-                    col = batch[source_col_name]
-
-                    # Add the column to the batch
-                    batch = ops.append_column(batch, column_name, col)
-
-                else:
-                    raise ValueError(f"Unknown source: {column_source}")
+            # if the source is a column, copy the existing column under the new name
+            else:
+                batch = ops.append_column(batch, column_name, batch[source_key])
 
-                # Apply function if specified (works for both extract_vars and column sources)
-                if field_config.func:
-                    func_args = field_config.func_args or []
-                    func_kwargs = field_config.func_kwargs or {}
-                    col = ops.apply(batch[column_name], field_config.func, *func_args, **func_kwargs)
-                    batch = ops.replace_column(batch, column_name, col)
+            # Apply function if specified (works for both extract_vars and column sources)
+            if func:
+                col = ops.apply(batch[column_name], func, *func_args, **func_kwargs)
+                batch = ops.replace_column(batch, column_name, col)
 
-                batch = ops.cast_column(batch, column_name, dtype)
+            batch = ops.cast_column(batch, column_name, dtype)
 
         if self.metadata_config.standard_metadata:
-
-            knowledge_time = self.get_knowledge_time(raw_file)
-
-            # metadata information (scalars only - no lists!)
-            md = {
-                "_source_file": raw_file.full_file_name,
-                "_source_file_mtime": raw_file.meta_data["file_mtime"],
-                "_creation_time": raw_file.creation_time,
-                "_knowledge_time": knowledge_time,
-                "_knowledge_date": knowledge_time.date(),
-            }
-
-            schema_hints = {
-                "_source_file": LogicalType.STRING,
-                "_source_file_mtime": TimestampType(unit="us", tz="UTC"),
-                "_creation_time": TimestampType(unit="us", tz="UTC"),
-                "_knowledge_time": TimestampType(unit="us", tz="UTC"),
-                "_knowledge_date": LogicalType.DATE32,
-            }
-
-            # Add constant columns
-            batch = ops.append_constant_columns(batch, md, schema_hints)
-
-            # Add _index column as a range (memory efficient)
-            batch = ops.append_range_column(batch, "_index", start_index, LogicalType.INT64)
+            # Standard columns are built via the vectorized base-class helper;
+            # extra constants ride along in the same single append
+            batch = self._append_standard_metadata(batch, start_index, raw_file, extra_constants, extra_schema_hints)
+        elif extra_constants:
+            batch = ops.append_constant_columns(batch, extra_constants, extra_schema_hints)
 
         return batch
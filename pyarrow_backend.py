@@ -127,11 +127,27 @@ class PyArrowOps(BatchOps):
 
         t: pyarrow.Table = batch.unwrap()
         n = t.num_rows
+
+        # Collect all new arrays first, then rebuild the table once: each
+        # append_column rebinds every column and rebuilds the schema, so N
+        # appends would cost N schema rebuilds instead of 1.
+        arrays = list(t.columns)
+        fields = list(t.schema)
         for name, val in constants.items():
-            arr = pyarrow.repeat(val, n)
-            if schema_hints and name in schema_hints:
-                arr = arr.cast(_logical_type_to_arrow(schema_hints[name]))
-            t = t.append_column(name, arr)
+            hint = schema_hints.get(name) if schema_hints else None
+            if isinstance(val, str) and (hint is None or hint is LogicalType.STRING):
+                # Constant strings (ex: _source_file) are dictionary-encoded: n int32
+                # indices plus a single dictionary entry instead of n copies of the
+                # string. Parquet keeps this as a one-entry dictionary page.
+                indices = pyarrow.array(np.zeros(n, dtype=np.int32))
+                arr = pyarrow.DictionaryArray.from_arrays(indices, pyarrow.array([val], type=pyarrow.string()))
+            else:
+                arr = pyarrow.repeat(val, n)
+                if hint is not None:
+                    arr = arr.cast(_logical_type_to_arrow(hint))
+            arrays.append(arr)
+            fields.append(pyarrow.field(name, arr.type))
+        t = pyarrow.Table.from_arrays(arrays, schema=pyarrow.schema(fields))
         return PyArrowBatch(t)
 
     def ensure_backend_schema(self, logical: RecordSchema) -> pyarrow.Schema:
@@ -241,8 +257,10 @@ class PyArrowOps(BatchOps):
 
         t: pyarrow.Table = batch.unwrap()
         n = t.num_rows
-        # Create a range array efficiently using numpy
-        _numpy_array = np.arange(start, start + n)
+        # Create a range array efficiently using numpy. Pinning dtype=int64 keeps
+        # the pyarrow conversion zero-copy (buffer protocol) on every platform
+        # instead of falling back to a cast when the default int width differs.
+        _numpy_array = np.arange(start, start + n, dtype=np.int64)
         arr = pyarrow.array(_numpy_array, type=_logical_type_to_arrow(target_type))
         t = t.append_column(column_name, arr)
         return PyArrowBatch(t)
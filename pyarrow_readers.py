@@ -11,7 +11,7 @@ import pyarrow.parquet as pq
 from parquet_converter.backends.pyarrow_backend import PyArrowBatch
 from parquet_converter.core.types import Batch
 from parquet_converter.readers.base_readers import BaseReader
-from parquet_converter.utils.file_utils import open_file_raw
+from parquet_converter.utils.file_utils import advise_sequential, open_file_raw
 
 
 class PyArrowReader(BaseReader):
@@ -22,15 +22,16 @@ class PyArrowReader(BaseReader):
     """
 
     @abstractmethod
-    def open(self, file_path: str, **kwargs) -> Any:
-        """Opens the file and returns a file handler.
+    def open(self, file_path: str, **kwargs) -> tuple:
+        """Opens the file and returns a (file handler, temp dir) pair.
 
         Args:
             file_path (str): Path to the file to open.
             **kwargs: Additional keyword arguments for file opening.
 
         Returns:
-            Any: Backend-specific file handler object.
+            tuple: (file_handler, temp_dir) where temp_dir is None unless the
+            reader extracted to scratch space.
         """
         pass
 
@@ -116,7 +117,7 @@ class PyArrowCsvReader(PyArrowReader):
         # store options for read/parse/convert
         self.options = options if options else {}
 
-    def open(self, file_path: str, mode: str = "rb", is_zip: bool = False) -> tuple:
+    def open(self, file_path: str, mode: str = "rb", is_zip: bool = False, temp_root: Optional[str] = None) -> tuple:
         """Opens the CSV file and returns a file handler and temp directory.
 
         Handles both regular CSV files and CSV files within zip archives. For zip files,
@@ -126,6 +127,9 @@ class PyArrowCsvReader(PyArrowReader):
             file_path (str): Path to the CSV file. For zip files, format is "zip_path|member".
             mode (str): File open mode. Default is "rb" (read binary).
             is_zip (bool): Whether the file is within a zip archive. Default is False.
+            temp_root (Optional[str]): directory to create the per-file extraction
+                dir under. Callers processing many zip members pass one shared
+                root so stray extractions are swept up together. Default is /tmp.
 
         Returns:
             tuple: (file_handler, temp_dir) where file_handler is a BinaryIO object
@@ -133,7 +137,7 @@ class PyArrowCsvReader(PyArrowReader):
         """
         if is_zip:
             zip_path, csv_filename = file_path.split("|", 1)
-            temp_dir = TemporaryDirectory(dir="/tmp")
+            temp_dir = TemporaryDirectory(dir=temp_root if temp_root else "/tmp")
             zip_file = None
             try:
                 zip_file = ZipFile(zip_path, "r")
@@ -167,7 +171,7 @@ class PyArrowCsvReader(PyArrowReader):
             temp_dir.cleanup()
 
     def batch_read(
-        self, file_handler: BinaryIO, schema: Optional[Any] = None, **kwargs
+        self, file_handler: BinaryIO, schema: Optional[Any] = None, max_bytes: Optional[int] = None, **kwargs
     ) -> Generator[PyArrowBatch, None, None]:
         """Reads a CSV file and yields data in batches.
 
@@ -178,15 +182,24 @@ class PyArrowCsvReader(PyArrowReader):
             file_handler (BinaryIO): File handler from open() method (binary mode).
             schema (Optional[Any]): Optional PyArrow schema for type enforcement and
                 validation during reading.
+            max_bytes (Optional[int]): Overrides the read block size. Callers that
+                only need the first batch (ex: schema inference) pass a small
+                value so a full block_size is never read or decompressed.
             **kwargs: Additional keyword arguments (currently unused).
 
         Yields:
             PyArrowBatch: PyArrowBatch instances containing portions of the CSV data. Each
                 batch represents approximately block_size bytes of data.
         """
+        # One-shot scan: ask the kernel for aggressive readahead
+        advise_sequential(file_handler)
+
         # Build ReadOptions
         read_options_dict = self.options.get("read_options", {})
-        if "block_size" not in read_options_dict:
+        if max_bytes is not None:
+            read_options_dict = dict(read_options_dict)
+            read_options_dict["block_size"] = max_bytes
+        elif "block_size" not in read_options_dict:
             read_options_dict["block_size"] = self.block_size
         read_options = pcsv.ReadOptions(**read_options_dict)
 
@@ -214,7 +227,7 @@ class PyArrowCsvReader(PyArrowReader):
             )
 
             for batch in stream_reader:
-                table = pyarrow.Table.from_batches([batch])
+                table = pyarrow.Table.from_batches([batch], schema=batch.schema)
                 yield PyArrowBatch(table)
         finally:
             # Close stream reader if it exists
@@ -256,18 +269,18 @@ class PyArrowParquetReader(PyArrowReader):
         self.batch_size = batch_size
         self.encoding = encoding
 
-    def open(self, file_path: str, **kwargs) -> BinaryIO:
-        """Opens the parquet file and returns the file handler.
+    def open(self, file_path: str, **kwargs) -> tuple:
+        """Opens the parquet file and returns the (file handler, temp dir) pair.
 
         Args:
             file_path (str): Path to the parquet file.
             **kwargs: Additional keyword arguments.
 
         Returns:
-            pyarrow.parquet.ParquetFile: The opened parquet file handler.
+            tuple: (file_handler, None) — parquet needs no scratch space.
         """
         # Parquet files are binary, so encoding not used
-        return open_file_raw(file_path, mode="rb")
+        return open_file_raw(file_path, mode="rb"), None
 
     def close(self, file_handler: BinaryIO, **kwargs) -> None:
         """Close the file handler and perform cleanup.
@@ -298,7 +311,7 @@ class PyArrowParquetReader(PyArrowReader):
         parquet_file = pq.ParquetFile(file_handler, **self.kwargs)
 
         for batch in parquet_file.iter_batches(batch_size=self.batch_size):
-            table = pyarrow.Table.from_batches([batch])
+            table = pyarrow.Table.from_batches([batch], schema=batch.schema)
             yield PyArrowBatch(table)
 
 
@@ -337,8 +350,8 @@ class BloombergReader(PyArrowReader):
         self.block_size = round(1_048_576 * block_size_mb)
         self.encoding = encoding if encoding is not None else "utf-8"
 
-    def open(self, file_path: str, **kwargs) -> BinaryIO:
-        """Opens the Bloomberg file and returns a file handler.
+    def open(self, file_path: str, **kwargs) -> tuple:
+        """Opens the Bloomberg file and returns a (file handler, temp dir) pair.
 
         Handles both regular and gzipped Bloomberg files.
 
@@ -347,10 +360,10 @@ class BloombergReader(PyArrowReader):
             **kwargs: Additional keyword arguments.
 
         Returns:
-            Union[gzip.GzipFile, io.TextIOWrapper]: The opened file handler.
+            tuple: (file_handler, None) — Bloomberg files need no scratch space.
         """
         # Open in text mode for Bloomberg files since we need line-by-line reading
-        return open_file_raw(file_path, mode="rt", encoding=self.encoding)
+        return open_file_raw(file_path, mode="rt", encoding=self.encoding), None
 
     def close(self, file_handler: BinaryIO, **kwargs) -> None:
         """Closes the file handler.
@@ -416,7 +429,7 @@ class BloombergReader(PyArrowReader):
                         convert_options=convert_options,
                     ) as stream_reader:
                         for batch in stream_reader:
-                            table = pyarrow.Table.from_batches([batch])
+                            table = pyarrow.Table.from_batches([batch], schema=batch.schema)
                             yield PyArrowBatch(table)
                     data_buffer.close()
                     data_lines = []
@@ -465,7 +478,7 @@ class BloombergReader(PyArrowReader):
                         convert_options=convert_options,
                     ) as stream_reader:
                         for batch in stream_reader:
-                            table = pyarrow.Table.from_batches([batch])
+                            table = pyarrow.Table.from_batches([batch], schema=batch.schema)
                             yield PyArrowBatch(table)
                     data_buffer.close()
                     data_lines = []